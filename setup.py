@@ -30,7 +30,6 @@ setup(
     packages=find_packages(where="src", exclude=("tests",)),
     install_requires=[
         "black",
-        "deepmerge",
         "flake8",
         "isort",
         "lxml",
@@ -41,6 +40,9 @@ setup(
         "toml",
     ],
     extras_require={
+        "performance": [
+            "orjson",
+        ],
         "test": [
             "pytest",
             "pytest-cov",
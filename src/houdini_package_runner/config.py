@@ -5,13 +5,20 @@ from __future__ import annotations
 
 # Standard Library
 import abc
+import concurrent.futures
+import functools
 import importlib.resources
 import os
 import pathlib
 from typing import TYPE_CHECKING, Dict, List, Tuple
 
+try:
+    import tomllib  # type: ignore
+
+except ImportError:  # pragma: no cover
+    tomllib = None  # type: ignore
+
 # Third Party
-import deepmerge
 import toml
 
 # Imports for type checking.
@@ -81,6 +88,14 @@ class PackageRunnerConfig(BaseRunnerConfig):
 
     """
 
+    def __init__(self, runner_name: str):
+        super().__init__(runner_name)
+
+        # Cache of computed per-item config data.  The results only depend on
+        # the item's type and test state so they can be shared across the many
+        # items of the same type processed in a run.
+        self._item_data_cache: Dict[Tuple[str, type, bool], List] = {}
+
     # -------------------------------------------------------------------------
     # NON-PUBLIC METHODS
     # -------------------------------------------------------------------------
@@ -93,15 +108,14 @@ class PackageRunnerConfig(BaseRunnerConfig):
         :return: Any found config data.
 
         """
-        data = []
-
-        file_config = self.data.get("file", {})
+        # The config is already keyed by file name so use a direct lookup
+        # instead of scanning every entry.
+        file_options = self.data.get("file", {}).get(file_path.name)
 
-        for file_name, file_options in file_config.items():
-            if file_name == file_path.name:
-                data.extend(file_options.get(key, []))
+        if not file_options:
+            return []
 
-        return data
+        return list(file_options.get(key, []))
 
     def _get_item_config_data(self, item: BaseItem, key: str) -> List:
         """Get config data based on an item.
@@ -111,19 +125,26 @@ class PackageRunnerConfig(BaseRunnerConfig):
         :return: Any found config data.
 
         """
-        config_names = build_config_item_list(item)
+        cache_key = (key, type(item), item.is_test_item)
 
-        data = []
+        data = self._item_data_cache.get(cache_key)
+
+        if data is None:
+            config_names = build_config_item_list(item)
+
+            data = []
 
-        item_config = self.data.get("item", {})
+            item_config = self.data.get("item", {})
 
-        for config_name in config_names:
-            config_items = item_config.get(config_name, {})
-            data.extend(config_items.get(key, []))
+            for config_name in config_names:
+                config_items = item_config.get(config_name, {})
+                data.extend(config_items.get(key, []))
 
-        if item.is_test_item:
-            test_items = item_config.get("test_item", {})
-            data.extend(test_items.get(key, []))
+            if item.is_test_item:
+                test_items = item_config.get("test_item", {})
+                data.extend(test_items.get(key, []))
+
+            self._item_data_cache[cache_key] = data
 
         return data
 
@@ -166,6 +187,24 @@ class PackageRunnerConfig(BaseRunnerConfig):
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=None)
+def _build_config_name_list(item_type: type) -> Tuple[str, ...]:
+    """Build a list of a class's name and its super class names.
+
+    Class hierarchies never change at runtime so the result is cached per
+    type.
+
+    :param item_type: The type to get class names for.
+    :return: A list containing the class name as well as any super class names.
+
+    """
+    bases = [base.__name__ for base in _get_base_classes(item_type)]
+
+    names = [item_type.__name__] + bases
+
+    return tuple(names)
+
+
 def _find_config_files() -> List[pathlib.Path]:
     """Find any config files to read.
 
@@ -177,10 +216,17 @@ def _find_config_files() -> List[pathlib.Path]:
     """
     path_env = os.getenv("HOUDINI_PACKAGE_RUNNER_CONFIG_PATH")
 
-    # Load the packaged config file if none is specified.
+    # Load the packaged config file if none is specified.  files() hands back
+    # the resource directly, without the deprecated context manager's
+    # temp-file materialization round trip.
     if path_env is None:
-        with importlib.resources.path("houdini_package_runner", "runners.toml") as path:
-            paths = [path]
+        paths = [
+            pathlib.Path(
+                str(
+                    importlib.resources.files("houdini_package_runner") / "runners.toml"
+                )
+            )
+        ]
 
     else:
         path_components = path_env.split(os.path.pathsep)
@@ -203,16 +249,10 @@ def _get_base_classes(cls: type) -> List[type]:
     :return: A list of all the base classes.
 
     """
-    cls_bases = [base for base in cls.__bases__ if base not in (abc.ABC, object)]
-
-    bases = []
-
-    for base in cls_bases:
-        bases.append(base)
-
-        bases.extend(_get_base_classes(base))
-
-    return bases
+    # The class's cached MRO already linearizes the whole hierarchy, so there
+    # is no need to walk __bases__ recursively (which revisits diamond
+    # ancestors).
+    return [base for base in cls.__mro__[1:] if base not in (abc.ABC, object)]
 
 
 def _load_default_runner_config(runner_name: str) -> dict:
@@ -222,18 +262,78 @@ def _load_default_runner_config(runner_name: str) -> dict:
     :return: The configuration dictionary for the runner.
 
     """
-    paths = _find_config_files()
+    paths = tuple(_find_config_files())
 
+    return _load_runner_config_files(paths).get(runner_name, {})
+
+
+@functools.lru_cache(maxsize=None)
+def _load_runner_config_files(paths: Tuple[pathlib.Path, ...]) -> Dict:
+    """Load and merge the config data from a set of files.
+
+    The merged result is cached per path set so constructing configs for
+    multiple runners in one process only parses the files once.
+
+    :param paths: The config files to load.
+    :return: The merged config data.
+
+    """
     data: Dict = {}
 
-    # In the event of multiple files, process them all and do a deep merge, preferring
-    # data already found over new values in the event of collision.
-    for path in paths:
-        with path.open("r", encoding="utf-8") as handle:
-            path_data = toml.load(handle)
-            deepmerge.conservative_merger.merge(data, path_data)
+    # Overlap the file reads when there are several, then do a deep merge in
+    # path order, preferring data already found over new values in the event
+    # of collision.
+    if len(paths) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(paths))
+        ) as executor:
+            parsed = list(executor.map(_parse_config_file, paths))
+
+    else:
+        parsed = [_parse_config_file(path) for path in paths]
+
+    for path_data in parsed:
+        _merge_conservative(data, path_data)
+
+    return data
+
+
+def _merge_conservative(target: Dict, source: Dict) -> None:
+    """Merge source data into target data, preferring existing values.
+
+    Nested dicts are merged recursively; anything else already present in the
+    target wins over the source value.
 
-    return data.get(runner_name, {})
+    :param target: The data to merge into.
+    :param source: The data to merge from.
+    :return:
+
+    """
+    for key, value in source.items():
+        existing = target.get(key)
+
+        if isinstance(existing, dict) and isinstance(value, dict):
+            _merge_conservative(existing, value)
+
+        elif key not in target:
+            target[key] = value
+
+
+def _parse_config_file(path: pathlib.Path) -> Dict:
+    """Parse a single config file.
+
+    :param path: The config file to parse.
+    :return: The parsed config data.
+
+    """
+    # tomllib (Python 3.11+) parses straight from the binary stream, skipping
+    # the Python-level codec wrapping the text-mode toml path needs.
+    if tomllib is not None:
+        with path.open("rb") as handle:
+            return tomllib.load(handle)
+
+    with path.open("r", encoding="utf-8") as handle:
+        return toml.load(handle)
 
 
 # =============================================================================
@@ -248,8 +348,4 @@ def build_config_item_list(item: BaseItem) -> Tuple[str, ...]:
     :return: A list containing the item's class name as well as any super class names.
 
     """
-    bases = [base.__name__ for base in _get_base_classes(type(item))]
-
-    names = [type(item).__name__] + bases
-
-    return tuple(names)
+    return _build_config_name_list(type(item))
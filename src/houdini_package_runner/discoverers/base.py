@@ -30,6 +30,8 @@ class BaseItemDiscoverer(metaclass=abc.ABCMeta):
 
     """
 
+    __slots__ = ("_items", "_path")
+
     def __init__(
         self,
         path: pathlib.Path,
@@ -8,8 +8,11 @@
 from __future__ import annotations
 
 # Standard Library
+import fnmatch
+import os
 import pathlib
-from typing import TYPE_CHECKING, List, Optional
+import re
+from typing import TYPE_CHECKING, Iterator, List, Optional, Set
 
 # Houdini Package Runner
 import houdini_package_runner.parser
@@ -23,6 +26,14 @@ if TYPE_CHECKING:
     from houdini_package_runner.items.base import BaseFileItem, BaseItem
 
 
+# =============================================================================
+# GLOBALS
+# =============================================================================
+
+# Pattern matching python*libs directory names (e.g. python3.7libs).
+_PYTHON_LIBS_RE = re.compile(fnmatch.translate("python*libs"))
+
+
 # =============================================================================
 # CLASSES
 # =============================================================================
@@ -38,6 +49,8 @@ class PackageItemDiscoverer(BaseItemDiscoverer):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: pathlib.Path,
@@ -47,14 +60,20 @@ class PackageItemDiscoverer(BaseItemDiscoverer):
     ) -> None:
         super().__init__(path, items=items)
 
-        self.items.extend(get_houdini_items(houdini_items, path))
+        # Skip Houdini item discovery entirely for the common "just process
+        # these files" invocations.
+        if houdini_items:
+            self.items.extend(get_houdini_items(houdini_items, path))
 
         if extra_paths is not None:
             for extra_path in extra_paths:
-                if extra_path.is_file():
+                # Query the raw string to skip pathlib's per-call overhead.
+                path_str = os.fspath(extra_path)
+
+                if os.path.isfile(path_str):
                     self.items.append(filesystem.FileToProcess(extra_path))
 
-                elif extra_path.is_dir():  # pragma: no branch
+                elif os.path.isdir(path_str):  # pragma: no branch
                     result = process_directory(extra_path)
 
                     if result is not None:
@@ -62,82 +81,191 @@ class PackageItemDiscoverer(BaseItemDiscoverer):
 
 
 # =============================================================================
-# FUNCTIONS
+# NON-PUBLIC FUNCTIONS
 # =============================================================================
 
 
-def get_digital_asset_items(otl_path: pathlib.Path) -> List[BaseFileItem]:
-    """Get a list of shelf items to process.
+def _get_items_for_digital_assets(
+    houdini_root: pathlib.Path, item_name: str, child_dirs: Set[str]
+) -> List[BaseItem]:
+    """Get digital asset items for an item name.
 
-    :param otl_path: The path to the otls folder.
-    :return: A list otl items.
+    :param houdini_root: The root houdini directory.
+    :param item_name: The Houdini item name.
+    :param child_dirs: The names of the root's child directories.
+    :return: The found digital asset items.
 
     """
-    items: List[BaseFileItem] = []
+    if item_name not in child_dirs:
+        return []
 
-    for otl_folder in otl_path.iterdir():
-        if otl_folder.is_dir() and digital_asset.is_expanded_digital_asset_dir(
-            otl_folder
-        ):
-            items.append(digital_asset.DigitalAssetDirectory(otl_folder))
+    return get_digital_asset_items(houdini_root / item_name)
 
-        elif otl_folder.suffix in (".hda", ".otl"):
-            items.append(digital_asset.BinaryDigitalAssetFile(otl_folder))
 
-    return items
+def _get_items_for_directory(
+    houdini_root: pathlib.Path, item_name: str, child_dirs: Set[str]
+) -> List[BaseItem]:
+    """Get directory based items for an item name.
 
+    :param houdini_root: The root houdini directory.
+    :param item_name: The Houdini item name.
+    :param child_dirs: The names of the root's child directories.
+    :return: The found directory items.
 
-def get_houdini_items(
-    houdini_items: List[str], houdini_root: pathlib.Path
+    """
+    if item_name not in child_dirs:
+        return []
+
+    item = process_directory(houdini_root / item_name)
+
+    return [item] if item is not None else []
+
+
+def _get_items_for_menus(
+    houdini_root: pathlib.Path,
+    item_name: str,  # pylint: disable=unused-argument
+    child_dirs: Set[str],  # pylint: disable=unused-argument
 ) -> List[BaseItem]:
-    """Get Houdini-related items to process.
+    """Get menu items for an item name.
 
-    :param houdini_items: The Houdini item names.
     :param houdini_root: The root houdini directory.
-    :return: The Houdini items to process.
+    :param item_name: The Houdini item name.
+    :param child_dirs: The names of the root's child directories.
+    :return: The found menu items.
 
     """
-    items: List[BaseItem] = []
+    return get_menu_items(houdini_root)
 
-    for item_name in houdini_items:
-        if not item_name:
-            continue
 
-        item_path = houdini_root / item_name
+def _get_items_for_python_libs(
+    houdini_root: pathlib.Path,
+    item_name: str,  # pylint: disable=unused-argument
+    child_dirs: Set[str],
+) -> List[BaseItem]:
+    """Get Python library directory items for an item name.
+
+    :param houdini_root: The root houdini directory.
+    :param item_name: The Houdini item name.
+    :param child_dirs: The names of the root's child directories.
+    :return: The found Python library items.
+
+    """
+    return [
+        filesystem.HoudiniDirectoryItem(houdini_root / name, traverse_children=True)
+        for name in child_dirs
+        if _PYTHON_LIBS_RE.match(name)
+    ]
+
+
+def _get_items_for_python_panels(
+    houdini_root: pathlib.Path,
+    item_name: str,
+    child_dirs: Set[str],  # pylint: disable=unused-argument
+) -> List[BaseItem]:
+    """Get python panel items for an item name.
+
+    :param houdini_root: The root houdini directory.
+    :param item_name: The Houdini item name.
+    :param child_dirs: The names of the root's child directories.
+    :return: The found python panel items.
+
+    """
+    return get_python_panel_items(houdini_root / item_name)
+
+
+def _get_items_for_toolbar(
+    houdini_root: pathlib.Path,
+    item_name: str,
+    child_dirs: Set[str],  # pylint: disable=unused-argument
+) -> List[BaseItem]:
+    """Get shelf tool items for an item name.
+
+    :param houdini_root: The root houdini directory.
+    :param item_name: The Houdini item name.
+    :param child_dirs: The names of the root's child directories.
+    :return: The found shelf tool items.
+
+    """
+    return get_tool_items(houdini_root / item_name)
 
-        if item_name in ("otls", "hda"):
-            if not item_path.is_dir():
-                continue
 
-            items.extend(get_digital_asset_items(item_path))
+# Dispatch table mapping known Houdini item names to their handlers.  Unknown
+# names fall through to directory processing.
+_ITEM_HANDLERS = {
+    "otls": _get_items_for_digital_assets,
+    "hda": _get_items_for_digital_assets,
+    "toolbar": _get_items_for_toolbar,
+    "python_panels": _get_items_for_python_panels,
+    "menus": _get_items_for_menus,
+    "pythonXlibs": _get_items_for_python_libs,
+}
 
-        elif item_name == "toolbar":
-            items.extend(get_tool_items(item_path))
 
-        elif item_name == "python_panels":
-            items.extend(get_python_panel_items(item_path))
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def get_digital_asset_items(otl_path: pathlib.Path) -> List[BaseFileItem]:
+    """Get a list of shelf items to process.
 
-        elif item_name == "menus":
-            items.extend(get_menu_items(houdini_root))
+    :param otl_path: The path to the otls folder.
+    :return: A list otl items.
 
-        elif item_name == "pythonXlibs":
-            python_lib_dirs = houdini_root.glob("python*libs")
+    """
+    items: List[BaseFileItem] = []
 
-            for lib_dir in python_lib_dirs:
+    # Use os.scandir() rather than iterating Path objects as the dir entries can
+    # answer is_dir() from the readdir data without any extra stat calls.
+    with os.scandir(otl_path) as scanner:
+        for entry in scanner:
+            if entry.is_dir(follow_symlinks=False):
+                # DirEntry.path is already the joined string, so the probe
+                # runs without constructing a Path for unselected entries.
+                if digital_asset.is_expanded_digital_asset_dir(entry.path):
+                    items.append(
+                        digital_asset.DigitalAssetDirectory(pathlib.Path(entry.path))
+                    )
+                    continue
+
+            if entry.name.endswith((".hda", ".otl")):
                 items.append(
-                    filesystem.HoudiniDirectoryItem(lib_dir, traverse_children=True)
+                    digital_asset.BinaryDigitalAssetFile(pathlib.Path(entry.path))
                 )
 
-        else:
-            if not item_path.is_dir():
-                continue
+    return items
 
-            item = process_directory(item_path)
 
-            if item is not None:
-                items.append(item)
+def get_houdini_items(
+    houdini_items: List[str], houdini_root: pathlib.Path
+) -> Iterator[BaseItem]:
+    """Generate Houdini-related items to process.
 
-    return items
+    Items are generated lazily so discovery streams into consumers without
+    materializing an intermediate list of every item.
+
+    :param houdini_items: The Houdini item names.
+    :param houdini_root: The root houdini directory.
+    :return: The Houdini items to process.
+
+    """
+    # Enumerate the root's child directories once; the handlers answer their
+    # existence checks from this set instead of issuing per-item stats.
+    try:
+        with os.scandir(houdini_root) as scanner:
+            child_dirs = {entry.name for entry in scanner if entry.is_dir()}
+
+    except FileNotFoundError:
+        child_dirs = set()
+
+    for item_name in houdini_items:
+        if not item_name:
+            continue
+
+        # Dispatch via a dict lookup rather than a chain of comparisons.
+        handler = _ITEM_HANDLERS.get(item_name, _get_items_for_directory)
+
+        yield from handler(houdini_root, item_name, child_dirs)
 
 
 def get_menu_items(houdini_root: pathlib.Path) -> List[xml.MenuFile]:
@@ -147,9 +275,16 @@ def get_menu_items(houdini_root: pathlib.Path) -> List[xml.MenuFile]:
     :return: A list of menu items.
 
     """
-    menu_files = [xml.MenuFile(menu_file) for menu_file in houdini_root.glob("*.xml")]
+    try:
+        with os.scandir(houdini_root) as scanner:
+            return [
+                xml.MenuFile(pathlib.Path(entry.path))
+                for entry in scanner
+                if entry.name.endswith(".xml") and entry.is_file()
+            ]
 
-    return menu_files
+    except FileNotFoundError:
+        return []
 
 
 def get_python_panel_items(
@@ -161,12 +296,16 @@ def get_python_panel_items(
     :return: A list of shelf python panel items.
 
     """
-    panel_files = [
-        xml.PythonPanelFile(panel_file)
-        for panel_file in python_panel_path.glob("*.pypanel")
-    ]
+    try:
+        with os.scandir(python_panel_path) as scanner:
+            return [
+                xml.PythonPanelFile(pathlib.Path(entry.path))
+                for entry in scanner
+                if entry.name.endswith(".pypanel") and entry.is_file()
+            ]
 
-    return panel_files
+    except FileNotFoundError:
+        return []
 
 
 def get_tool_items(toolbar_path: pathlib.Path) -> List[xml.ShelfFile]:
@@ -176,11 +315,16 @@ def get_tool_items(toolbar_path: pathlib.Path) -> List[xml.ShelfFile]:
     :return: A list of shelf tool items.
 
     """
-    shelf_files = [
-        xml.ShelfFile(shelf_file) for shelf_file in toolbar_path.glob("*.shelf")
-    ]
+    try:
+        with os.scandir(toolbar_path) as scanner:
+            return [
+                xml.ShelfFile(pathlib.Path(entry.path))
+                for entry in scanner
+                if entry.name.endswith(".shelf") and entry.is_file()
+            ]
 
-    return shelf_files
+    except FileNotFoundError:
+        return []
 
 
 def init_standard_package_discoverer(
@@ -215,7 +359,8 @@ def process_directory(dir_path: pathlib.Path) -> filesystem.DirectoryToProcess:
     :return: The corresponding directory item type.
 
     """
-    if (dir_path / "__init__.py").exists():
+    # A single stat on the joined string, with no intermediate Path.
+    if os.path.isfile(os.path.join(os.fspath(dir_path), "__init__.py")):
         return filesystem.PythonPackageDirectoryItem(dir_path)
 
     if dir_path.name == "python":
@@ -30,6 +30,14 @@ class BaseItem(ABC):
 
     """
 
+    __slots__ = (
+        "_contents_changed",
+        "_ignored_builtins",
+        "_is_single_line",
+        "_is_test_item",
+        "_write_back",
+    )
+
     def __init__(self, write_back: bool = False) -> None:
         self._contents_changed = False
         self._ignored_builtins: List[str] = []
@@ -113,6 +121,8 @@ class BaseFileItem(BaseItem):
 
     """
 
+    __slots__ = ("_path",)
+
     def __init__(self, path: pathlib.Path, write_back: bool = False) -> None:
         super().__init__(write_back=write_back)
         self._path = path
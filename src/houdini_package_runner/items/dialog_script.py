@@ -9,14 +9,17 @@ from __future__ import annotations
 
 # Standard Library
 import abc
+import functools
 import operator
+import re
 from collections import namedtuple
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 # Third Party
 import pyparsing  # type: ignore
 
 # Houdini Package Runner
+import houdini_package_runner.utils
 from houdini_package_runner.items.base import BaseFileItem, BaseItem
 
 # Imports for type checking.
@@ -35,6 +38,10 @@ if TYPE_CHECKING:
 # for the unenviable task of writing this such that we may repurpose it for
 # our own use.
 
+# Memoize sub-expression matches so the nested grammars don't re-backtrack
+# over the same tokens while scanning large DialogScript sections.
+pyparsing.ParserElement.enablePackrat(cache_size_limit=4096)
+
 _DS_NAME_EXPR_GRAMMAR = (
     pyparsing.Keyword("name").suppress() + pyparsing.QuotedString('"')
 ).parseWithTabs()
@@ -50,10 +57,10 @@ _DS_DEF_EXPR_TYPED = (
     + pyparsing.Literal("]").suppress()
 )
 
-_DS_DEF_EXPR_LIT = (
-    pyparsing.QuotedString(quoteChar='"', escChar="\\", multiline=True).suppress()
-    | pyparsing.Word(pyparsing.nums).suppress()
-)
+# A non-Python default entry: a (possibly multiline) quoted string or a bare
+# number.  A single regex alternation beats the combinator pair as it needs
+# no backtracking between the two branches.
+_DS_DEF_EXPR_LIT = pyparsing.Regex(r'"(?:\\.|[^"\\])*"|\d+', flags=re.DOTALL).suppress()
 
 _DS_DEF_EXPR_GRAMMAR = (
     pyparsing.Keyword("default").suppress()
@@ -99,6 +106,27 @@ _DS_PARM_GRAMMAR = pyparsing.originalTextFor(
     pyparsing.Keyword("parm") + pyparsing.nestedExpr("{", "}")
 ).parseWithTabs()
 
+# Combined grammar matching any of the script bearing constructs inside a
+# parameter definition, so a block is scanned once for all of them instead of
+# once per construct type.
+_DS_PARM_INNER_GRAMMAR = (
+    pyparsing.Group(_DS_CB_SCRIPT_LANG_GRAMMAR)("callback_language")
+    | pyparsing.Group(_DS_CB_SCRIPT_GRAMMAR)("callback")
+    | pyparsing.Group(_DS_DEF_EXPR_GRAMMAR)("defaults")
+    | pyparsing.Group(_DS_MENU_GRAMMAR)("menu")
+).parseWithTabs()
+
+# Cheap prefilter locating candidate parameter block starts, so the grammar
+# is only applied at those offsets rather than attempted at every character.
+_PARM_START_RE = re.compile(r"\bparm\s*\{")
+
+# A run of newline characters.
+_NEWLINES_RE = re.compile(r"[\r\n]*")
+
+# Translation table escaping the characters which can't appear verbatim in a
+# single line script value.
+_SINGLE_LINE_ESCAPES = str.maketrans({"\r": "\\r", "\n": "\\n", '"': '\\"'})
+
 
 PythonMenuScriptResult = namedtuple(
     "PythonMenuScriptResult", ["menu_script", "span", "indent", "uses_tabs"]
@@ -133,10 +161,6 @@ class DialogScriptItem(BaseFileItem):
         self._name = name
         self._source_file = source_file
 
-        # Stash the script contents.
-        with self.path.open(encoding="utf-8") as handle:
-            self._ds_contents = handle.read()
-
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.name} ({self.path})>"
 
@@ -144,6 +168,17 @@ class DialogScriptItem(BaseFileItem):
     # NON-PUBLIC METHODS
     # -------------------------------------------------------------------------
 
+    @functools.cached_property
+    def _ds_contents(self) -> str:
+        """The DialogScript contents.
+
+        The file is read lazily on first access so that constructing items
+        during discovery does no I/O, and in one read_text call so large
+        sources come in with a single large read.
+
+        """
+        return self.path.read_text(encoding="utf-8")
+
     def _gather_items(self) -> Tuple[DialogScriptInternalItem, ...]:
         """Gather the items from the DialogScript to process.
 
@@ -152,19 +187,23 @@ class DialogScriptItem(BaseFileItem):
         """
         items: List[DialogScriptInternalItem] = []
 
-        for match, parm_start, _ in _DS_PARM_GRAMMAR.scanString(self._ds_contents):
-            # The block of code related to the parameter definition.
-            parm = match.asList()[0]
+        for match, parm_start in _scan_parm_definitions(self._ds_contents):
+            # The block of code related to the parameter definition.  Index
+            # the ParseResults directly; asList() would deep-copy the whole
+            # parse tree just to grab the first element.
+            parm = match[0]
 
-            items.extend(_get_callback_items(parm, parm_start, self.name))
+            items.extend(_get_parm_items(parm, parm_start, self.name))
 
-            items.extend(_get_expression_items(parm, parm_start, self.name))
+        # Sub-item temp names derive from display names, which can repeat
+        # between asset libraries, so key each item's temp directory to this
+        # file.  Also set the 'write_back' property if necessary.
+        temp_dir_token = str(self.path)
 
-            items.extend(_get_menu_items(parm, parm_start, self.name))
+        for item in items:
+            item.temp_dir_token = temp_dir_token
 
-        # Set the 'write_back' property of all the items if necessary.
-        if self.write_back:
-            for item in items:
+            if self.write_back:
                 item.write_back = True
 
         return tuple(items)
@@ -179,20 +218,25 @@ class DialogScriptItem(BaseFileItem):
         """
         items_with_changed_contents.sort(key=operator.attrgetter("start_offset"))
 
-        parts = []
+        parts: List[str] = []
+
+        # Hoist the per-iteration attribute lookups out of the loop.
+        ds_contents = self._ds_contents
+        parts_append = parts.append
 
         script_offset = 0
 
         for item in items_with_changed_contents:
-            parts.append(self._ds_contents[script_offset : item.start_offset])
-            parts.append(item.post_processed_code)
+            parts_append(ds_contents[script_offset : item.start_offset])
+            parts_append(item.post_processed_code)
             script_offset = item.end_offset
 
-        parts.append(self._ds_contents[script_offset:])
-        new_dialog_script = "".join(parts)
+        parts_append(ds_contents[script_offset:])
 
+        # Stream the parts straight to the file; joining first would build a
+        # second full copy of the script just to write it out.
         with open(self.path, "w", encoding="utf-8") as handle:
-            handle.write(new_dialog_script)
+            handle.writelines(parts)
 
     # -------------------------------------------------------------------------
     # PROPERTIES
@@ -218,19 +262,21 @@ class DialogScriptItem(BaseFileItem):
         """
         files_to_process = self._gather_items()
 
-        result = 0
-
-        items_with_changed_contents = []
-
-        for file_to_process in files_to_process:
-            result |= file_to_process.process(runner)
+        # The sub-items write to distinct temp files, so under --parallel
+        # they can be checked concurrently.
+        result = houdini_package_runner.utils.process_items(files_to_process, runner)
 
-            if file_to_process.contents_changed:
-                items_with_changed_contents.append(file_to_process)
+        # The changed-contents accounting only matters when writing back.
+        if self.write_back:
+            items_with_changed_contents = [
+                file_to_process
+                for file_to_process in files_to_process
+                if file_to_process.contents_changed
+            ]
 
-        if self.write_back and items_with_changed_contents:
-            self.contents_changed = True
-            self._handle_changed_contents(items_with_changed_contents)
+            if items_with_changed_contents:
+                self.contents_changed = True
+                self._handle_changed_contents(items_with_changed_contents)
 
         return result
 
@@ -247,6 +293,18 @@ class DialogScriptInternalItem(BaseItem, metaclass=abc.ABCMeta):
 
     """
 
+    __slots__ = (
+        "_code",
+        "_display_hint",
+        "_display_name",
+        "_end_offset",
+        "_name",
+        "_parm",
+        "_post_processed_code",
+        "_start_offset",
+        "_temp_dir_token",
+    )
+
     def __init__(
         self,
         parm: str,
@@ -263,13 +321,14 @@ class DialogScriptInternalItem(BaseItem, metaclass=abc.ABCMeta):
         self._parm = parm
         self._start_offset = start_offset
 
-        name = _DS_NAME_EXPR_GRAMMAR.searchString(parm)[0][0]
+        name = _get_parm_name(parm)
 
         self._name = name
         self._display_hint = ""
         self._display_name = display_name + "_" + name
 
         self._post_processed_code = code
+        self._temp_dir_token: Optional[str] = None
 
         # The 'hou' module is always available in these items.
         self.ignored_builtins.append("hou")
@@ -326,9 +385,9 @@ class DialogScriptInternalItem(BaseItem, metaclass=abc.ABCMeta):
         if not code.endswith("\n"):
             code += "\n"
 
-        # Dump the code to the temp file, so it can be processed.
-        with temp_path.open("w") as handle:
-            handle.write(code)
+        # Dump the code to the temp file, so it can be processed.  write_text
+        # is one open/write/close cycle rather than three separate steps.
+        temp_path.write_text(code)
 
     # -------------------------------------------------------------------------
     # PROPERTIES
@@ -374,6 +433,15 @@ class DialogScriptInternalItem(BaseItem, metaclass=abc.ABCMeta):
         """The post-processing contents."""
         return self._post_processed_code
 
+    @property
+    def temp_dir_token(self) -> Optional[str]:
+        """Token identifying the parent item for temp file placement."""
+        return self._temp_dir_token
+
+    @temp_dir_token.setter
+    def temp_dir_token(self, temp_dir_token: str):
+        self._temp_dir_token = temp_dir_token
+
     # -------------------------------------------------------------------------
     # METHODS
     # -------------------------------------------------------------------------
@@ -387,7 +455,17 @@ class DialogScriptInternalItem(BaseItem, metaclass=abc.ABCMeta):
         :return: The process return code.
 
         """
-        temp_path = runner.temp_dir / f"{self.display_name}.py"
+        temp_dir = runner.temp_dir
+
+        # Display names are only unique within the parent DialogScript, so
+        # place the temp file under a parent specific subdirectory when a
+        # token was provided and items may process concurrently.
+        if self._temp_dir_token is not None:
+            temp_dir = houdini_package_runner.utils.get_item_temp_dir(
+                runner.temp_dir, self._temp_dir_token
+            )
+
+        temp_path = temp_dir / f"{self.display_name}.py"
 
         self._write_contents(temp_path)
 
@@ -416,6 +494,8 @@ class DialogScriptCallbackItem(DialogScriptInternalItem):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         parm: str,
@@ -451,6 +531,8 @@ class DialogScriptDefaultExpressionItem(DialogScriptInternalItem):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         parm: str,
@@ -482,6 +564,8 @@ class DialogScriptMenuScriptItem(DialogScriptInternalItem):
 
     """
 
+    __slots__ = ("_menu_script_data",)
+
     def __init__(
         self,
         parm: str,
@@ -523,15 +607,22 @@ class DialogScriptMenuScriptItem(DialogScriptInternalItem):
 
         """
         lines = contents.splitlines()
-        new_contents = ""
+
+        if not lines:
+            return ""
 
         indent_char = "\t" if self.menu_script_data.uses_tabs else " "
         indent = indent_char * self.menu_script_data.indent
 
-        for i, line in enumerate(lines):
-            new_contents += f'{"" if i == 0 else indent}[ "{line}" ]\n'
+        # The first line carries no indent; handling it separately keeps the
+        # per-line work to a single interpolation.  Collect the lines and
+        # join once, rather than quadratic string +=.
+        parts = [f'[ "{lines[0]}" ]\n']
+
+        for line in lines[1:]:
+            parts.append(f'{indent}[ "{line}" ]\n')
 
-        return new_contents
+        return "".join(parts)
 
     # -------------------------------------------------------------------------
     # PROPERTIES
@@ -548,6 +639,33 @@ class DialogScriptMenuScriptItem(DialogScriptInternalItem):
 # =============================================================================
 
 
+def _build_menu_script_result(
+    parm: str,
+    match: pyparsing.ParseResults,
+) -> PythonMenuScriptResult:
+    """Build the menu script data for a matched Python menu.
+
+    :param parm: The parameter data.
+    :param match: The matched menu grammar data.
+    :return: The Python menu script data.
+
+    """
+    # Index the ParseResults directly instead of deep-copying it into nested
+    # lists with asList().
+    start = match[0][0]
+    end = _discard_newlines(parm, match[-1][2])
+    menu_script = "\n".join(line[1] for line in match)
+
+    # Measure the indentation run preceding the script with C-level string
+    # ops rather than walking backwards character by character.
+    prefix = parm[:start]
+    whitespace = prefix[len(prefix.rstrip(" \t")) :]
+
+    return PythonMenuScriptResult(
+        menu_script, (start, end), len(whitespace), "\t" in whitespace
+    )
+
+
 def _discard_newlines(parm: str, start: int) -> int:
     """Discard any newline characters.
 
@@ -556,15 +674,13 @@ def _discard_newlines(parm: str, start: int) -> int:
     :return: The start index offset to discard any newlines
 
     """
-    pos = start
-
-    while pos < len(parm):
-        if parm[pos] not in ("\r", "\n"):
-            break
-
-        pos += 1
+    # The regex engine clamps out-of-range positions, so preserve the
+    # behavior of returning the start index untouched in that case.
+    if start >= len(parm):
+        return start
 
-    return pos
+    # One C-level scan over the newline run instead of a per-character loop.
+    return _NEWLINES_RE.match(parm, start).end()
 
 
 def _escape_contents_for_single_line(contents: str) -> str:
@@ -574,51 +690,8 @@ def _escape_contents_for_single_line(contents: str) -> str:
     :return: The contents with \r, \n and " escaped
 
     """
-    contents = contents.replace("\r", "\\r").replace("\n", "\\n").replace('"', '\\"')
-
-    return contents
-
-
-def _get_callback_items(
-    parm: str, parm_start: int, name: str
-) -> List[DialogScriptCallbackItem]:
-    """Build a list of any callback items for a parameter.
-
-    :param parm: The parameter data.
-    :param parm_start: The start position of the parm.
-    :param name: The display name.
-    :return: A list of any callback items.
-
-    """
-    items = []
-    # Get the parameter's callback script language.
-    callback_language = _get_callback_language(parm)
-
-    if callback_language == "python":
-        # Get the callback script data, if any.
-        result = _get_script_callback(parm)
-
-        if result is not None:
-            script, script_span = result
-
-            items.append(
-                DialogScriptCallbackItem(parm, script, parm_start, script_span, name)
-            )
-
-    return items
-
-
-def _get_callback_language(parm: str) -> Optional[str]:
-    """Get a parameter's callback script language.
-
-    :param parm: The parameter data.
-    :return: The script callback language.
-
-    """
-    for match in _DS_CB_SCRIPT_LANG_GRAMMAR.searchString(parm):
-        return match[0]
-
-    return None
+    # One translate pass instead of three replace passes over the contents.
+    return contents.translate(_SINGLE_LINE_ESCAPES)
 
 
 def _get_ds_file_offset(
@@ -637,121 +710,142 @@ def _get_ds_file_offset(
     return parm_start + span[0] + extra_offset, parm_start + span[1] - extra_offset
 
 
-def _get_default_python_expressions(
-    parm: str,
-) -> Tuple[Tuple[str, Tuple[int, int]], ...]:
-    """Get default Python expressions for a parameter tuple.
-
-    :param parm: The parameter data.
-    :return: Any default expressions which are Python.
-
-    """
-    expressions = []
-
-    for matches in _DS_DEF_EXPR_GRAMMAR.searchString(parm):
-        for match in matches:
-            (start, expr, end), expr_lang = match
-
-            if expr_lang == "python":
-                expressions.append((expr, (start, end)))
-
-    return tuple(expressions)
-
-
-def _get_expression_items(
+def _get_parm_items(
     parm: str, parm_start: int, name: str
-) -> List[DialogScriptDefaultExpressionItem]:
-    """Build a list of any expression items for a parameter.
+) -> List[DialogScriptInternalItem]:
+    """Build the processable items for a parameter definition.
+
+    The definition block is scanned a single time for all of the script
+    bearing constructs instead of once per construct type.
 
     :param parm: The parameter data.
     :param parm_start: The start position of the parm.
     :param name: The display name.
-    :return: A list of any expression items.
+    :return: A list of the parameter's processable items.
 
     """
-    items = []
+    callback_language, callback_data, python_expressions, menu_match = (
+        _scan_parm_constructs(parm)
+    )
+
+    items: List[DialogScriptInternalItem] = []
 
-    default_python_expressions = _get_default_python_expressions(parm)
+    if callback_language == "python" and callback_data is not None:
+        script, script_span = callback_data
+
+        items.append(
+            DialogScriptCallbackItem(parm, script, parm_start, script_span, name)
+        )
 
     # Enumerate so we can get an index to make the items unique in the event the
     # parameter has more than one component.  This is not guaranteed to match the
     # actual parameter index of the data as it is possible that any of the components
     # have defaults which are not expressions or are Hscript expressions.
-    for idx, (expr, span) in enumerate(default_python_expressions):
+    for idx, (expr, span) in enumerate(python_expressions):
         items.append(
             DialogScriptDefaultExpressionItem(parm, expr, parm_start, span, name, idx)
         )
 
+    if menu_match is not None:
+        items.append(
+            DialogScriptMenuScriptItem(
+                parm, parm_start, name, _build_menu_script_result(parm, menu_match)
+            )
+        )
+
     return items
 
 
-def _get_menu_items(
-    parm: str, parm_start: int, name: str
-) -> List[DialogScriptMenuScriptItem]:
-    """Build a list of any menu script items for a parameter.
+@functools.lru_cache(maxsize=4096)
+def _get_parm_name(parm: str) -> str:
+    """Get the name of a parameter definition.
+
+    The result is cached since a multi-component parameter constructs several
+    items from the same definition block.
 
     :param parm: The parameter data.
-    :param parm_start: The start position of the parm.
-    :param name: The display name.
-    :return: A list of any menu script items.
+    :return: The parameter name.
 
     """
-    items = []
-
-    # Get any Python menu script data if it exists.
-    menu_script = _get_python_menu_script(parm)
-
-    if menu_script is not None:
-        items.append(DialogScriptMenuScriptItem(parm, parm_start, name, menu_script))
-
-    return items
+    return _DS_NAME_EXPR_GRAMMAR.searchString(parm)[0][0]
 
 
-def _get_python_menu_script(parm: str) -> Optional[PythonMenuScriptResult]:
-    """Get any Python menu script data for a parameter.
+def _scan_parm_constructs(
+    parm: str,
+) -> Tuple[
+    Optional[str],
+    Optional[Tuple[str, Tuple[int, int]]],
+    List[Tuple[str, Tuple[int, int]]],
+    Optional[pyparsing.ParseResults],
+]:
+    """Scan a parameter definition for its script bearing constructs.
 
     :param parm: The parameter data.
-    :return: The menu script data if the parameter has a Python one.
+    :return: The callback language, callback script data, Python default
+        expressions and menu match, where found.
 
     """
-    for match in _DS_MENU_GRAMMAR.searchString(parm):
-        lines = match.asList()
-        start = lines[0][0]
-        end = _discard_newlines(parm, lines[-1][2])
-        menu_script = "\n".join([line[1] for line in lines])
-        indent = 0
+    callback_language = None
+    callback_data = None
+    python_expressions = []
+    menu_match = None
 
-        uses_tabs = False
+    for match in _DS_PARM_INNER_GRAMMAR.searchString(parm):
+        if "callback_language" in match:
+            # The first language entry wins.
+            if callback_language is None:
+                callback_language = match["callback_language"][0]
 
-        for i in range(start - 1, 0, -1):  # pragma: no branch
-            if parm[i] == " ":
-                indent += 1
+        elif "callback" in match:
+            # There can only be one callback script entry per parameter.
+            if callback_data is None:
+                start, text, end = match["callback"][0]
+                callback_data = (text, (start, end))
 
-            elif parm[i] == "\t":
-                indent += 1
-                uses_tabs = True
+        elif "defaults" in match:
+            for entry in match["defaults"]:
+                (start, expr, end), expr_lang = entry
 
-            else:
-                break
+                if expr_lang == "python":
+                    python_expressions.append((expr, (start, end)))
 
-        # There can only be one menu script so return it.
-        return PythonMenuScriptResult(menu_script, (start, end), indent, uses_tabs)
+        # There can only be one menu script per parameter.
+        elif "menu" in match and menu_match is None:  # pragma: no branch
+            menu_match = match["menu"]
 
-    return None
+    return callback_language, callback_data, python_expressions, menu_match
 
 
-def _get_script_callback(parm: str) -> Optional[Tuple[str, Tuple[int, int]]]:
-    """Get the callback script data for a parameter if it has one.
+def _scan_parm_definitions(
+    contents: str,
+) -> Iterator[Tuple[pyparsing.ParseResults, int]]:
+    """Generate the parameter definition matches in DialogScript contents.
 
-    The result contains the script contents and start/end offset values.
+    The prefilter regex finds candidate 'parm {' starts and the grammar is
+    only applied at those offsets, instead of scanString attempting a match
+    at every character position of the file.
 
-    :param parm: The parameter data.
-    :return: The parameter callback script if the parameter has one.
+    :param contents: The DialogScript contents.
+    :return: The parameter definition matches and their start offsets.
 
     """
-    for match in _DS_CB_SCRIPT_GRAMMAR.searchString(parm):
-        # There can only been one callback script entry per parameter.
-        start, text, end = match[0]
-        return text, (start, end)
+    scan_end = 0
+
+    for candidate in _PARM_START_RE.finditer(contents):
+        start = candidate.start()
+
+        # Skip candidates inside an already matched block, e.g. script
+        # strings which happen to mention 'parm {'.
+        if start < scan_end:
+            continue
+
+        try:
+            # The same internal entry point scanString drives; it parses at
+            # an explicit offset without slicing the source.
+            # pylint: disable-next=protected-access
+            scan_end, match = _DS_PARM_GRAMMAR._parse(contents, start)
+
+        except pyparsing.ParseBaseException:
+            continue
 
-    return None
+        yield match, start
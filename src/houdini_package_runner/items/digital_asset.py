@@ -11,7 +11,14 @@ from __future__ import annotations
 import json
 import os
 import pathlib
-from typing import TYPE_CHECKING, List, Optional
+import sys
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson  # type: ignore
+
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 # Houdini Package Runner
 import houdini_package_runner.utils
@@ -25,6 +32,14 @@ if TYPE_CHECKING:
     import houdini_package_runner.runners.base
 
 
+# =============================================================================
+# GLOBALS
+# =============================================================================
+
+# Key suffix identifying Python sections in ExtraFileOptions data.
+_IS_PYTHON_SUFFIX = "/IsPython"
+
+
 # =============================================================================
 # CLASSES
 # =============================================================================
@@ -39,6 +54,8 @@ class DigitalAssetPythonSection(FileToProcess):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self, path: pathlib.Path, display_name: str, write_back: bool = False
     ) -> None:
@@ -57,19 +74,22 @@ class ExpandedOperatorType(BaseFileItem):
     :param path: The path to the operator specific folder.
     :param name: The name of the operator.
     :param write_back: Whether the item should write itself back to disk.
-    :param source_file: Optional source file for the expanded operator definition.
+    :param source_file: Optional source file label for the expanded operator definition.
 
     """
 
+    __slots__ = ("_child_entries", "_name", "_source_file")
+
     def __init__(
         self,
         path: pathlib.Path,
         name: str,
         write_back: bool = False,
-        source_file: pathlib.PurePath = None,
+        source_file: str = None,
     ) -> None:
         super().__init__(path, write_back=write_back)
 
+        self._child_entries: Optional[Dict[str, os.DirEntry]] = None
         self._name = name
         self._source_file = source_file
 
@@ -91,22 +111,22 @@ class ExpandedOperatorType(BaseFileItem):
         """
         files_to_process = []
 
-        for section_path in python_sections:
-            if self._source_file is not None:
-                display_name = self._source_file / section_path.name
-
-            else:
-                display_name = self.path / section_path.name
+        # The display names are purely labels so build them with plain string
+        # joins instead of constructing intermediate path objects.
+        base_path = (
+            self._source_file if self._source_file is not None else str(self.path)
+        )
 
+        for section_path in python_sections:
             files_to_process.append(
                 DigitalAssetPythonSection(
                     section_path,
-                    str(display_name),
+                    os.path.join(base_path, section_path.name),
                     write_back=self.write_back,
                 )
             )
 
-        return list(files_to_process)
+        return files_to_process
 
     def _find_internal_shelf_item(self) -> Optional[ShelfFile]:
         """Find the internal shelf item to process, if possible.
@@ -115,15 +135,15 @@ class ExpandedOperatorType(BaseFileItem):
 
         """
 
-        shelf_path = self.path / "Tools.shelf"
-
-        if not shelf_path.exists():
+        if "Tools.shelf" not in self._scan_children():
             return None
 
+        shelf_path = self.path / "Tools.shelf"
+
         display_name = None
 
         if self._source_file is not None:
-            display_name = str(self._source_file / "Tools.shelf")
+            display_name = os.path.join(self._source_file, "Tools.shelf")
 
         item = ShelfFile(
             shelf_path,
@@ -146,10 +166,8 @@ class ExpandedOperatorType(BaseFileItem):
         python_sections = self._get_extra_python_section_files()
 
         # PythonCook sections are implicitly Python so check for them manually.
-        python_cook_path = self.path / "PythonCook"
-
-        if python_cook_path.exists():
-            python_sections.append(python_cook_path)
+        if "PythonCook" in self._scan_children():
+            python_sections.append(self.path / "PythonCook")
 
         return python_sections
 
@@ -163,8 +181,8 @@ class ExpandedOperatorType(BaseFileItem):
         """
         python_sections = self._find_python_section_paths()
 
-        items_to_process: List[BaseFileItem] = list(
-            self._build_python_section_items(python_sections)
+        items_to_process: List[BaseFileItem] = self._build_python_section_items(
+            python_sections
         )
 
         shelf_item = self._find_internal_shelf_item()
@@ -185,7 +203,8 @@ class ExpandedOperatorType(BaseFileItem):
         dialog_script_path = self.path / "DialogScript"
 
         if self._source_file is not None:
-            display_name = self._source_file.stem.replace("::", "__") + "_DialogScript"
+            source_name = os.path.splitext(os.path.basename(self._source_file))[0]
+            display_name = source_name.replace("::", "__") + "_DialogScript"
 
         else:
             display_name = (
@@ -204,23 +223,55 @@ class ExpandedOperatorType(BaseFileItem):
         """
         python_sections = []
 
+        # Avoid repeated attribute lookups and path joins in the key loop.
+        path = self.path
+
         # The extra file options file.
-        extra_options = self.path / "ExtraFileOptions"
+        extra_options = path / "ExtraFileOptions"
+
+        # Read the file directly and handle it not existing, rather than
+        # paying for a separate exists() stat up front.
+        try:
+            # Parse with orjson when it is available.  It is considerably
+            # faster than the stdlib parser and the options files for large
+            # assets can get sizeable.
+            if orjson is not None:
+                # pylint: disable-next=no-member
+                data = orjson.loads(extra_options.read_bytes())
+
+            else:
+                with extra_options.open() as handle:
+                    data = json.load(handle)
 
-        if extra_options.exists():
-            with extra_options.open() as handle:
-                data = json.load(handle)
+        except FileNotFoundError:
+            return python_sections
 
-            for key, values in data.items():
-                # Look for sections that are Python.
-                if "IsPython" in key:
-                    if values["value"]:
-                        script_name = key.split("/")[0]
-                        section_path = self.path / script_name
-                        python_sections.append(section_path)
+        # Option keys are structured as "<section>/IsPython" so a suffix
+        # check is cheaper than a substring scan of every key.
+        for key, values in data.items():
+            # Look for sections that are Python.
+            if key.endswith(_IS_PYTHON_SUFFIX) and values.get("value"):
+                # Section names recur between assets, so intern them.
+                script_name = sys.intern(key[: -len(_IS_PYTHON_SUFFIX)])
+                python_sections.append(path / script_name)
 
         return python_sections
 
+    def _scan_children(self) -> Dict[str, os.DirEntry]:
+        """Scan the operator directory, mapping the child entries by name.
+
+        The result is cached so the various section probes share a single
+        directory read instead of each issuing their own stat.
+
+        :return: A mapping of child entry names to their entries.
+
+        """
+        if self._child_entries is None:
+            with os.scandir(self.path) as scanner:
+                self._child_entries = {entry.name: entry for entry in scanner}
+
+        return self._child_entries
+
     # -------------------------------------------------------------------------
     # PROPERTIES
     # -------------------------------------------------------------------------
@@ -245,10 +296,9 @@ class ExpandedOperatorType(BaseFileItem):
         """
         items_to_process = self._gather_items()
 
-        result = 0
+        result = houdini_package_runner.utils.process_items(items_to_process, runner)
 
         for item in items_to_process:
-            result |= item.process(runner)
             self.contents_changed |= item.contents_changed
 
         return result
@@ -263,6 +313,8 @@ class DigitalAssetDirectory(BaseFileItem):
 
     """
 
+    __slots__ = ("_source_file",)
+
     def __init__(
         self, path: pathlib.Path, write_back=False, source_file: pathlib.PurePath = None
     ) -> None:
@@ -284,17 +336,23 @@ class DigitalAssetDirectory(BaseFileItem):
 
         operator_dirs = self._find_operator_dirs()
 
-        for definition in operator_dirs:
-            directory_name, operator_name = definition
+        # Hoist the per-iteration lookups out of the loop.
+        path = self.path
+        source_file = self._source_file
+        write_back = self.write_back
+
+        for directory_name, operator_name in operator_dirs:
             display_name = None
 
-            if self._source_file is not None:
-                display_name = pathlib.PurePath(f"{self._source_file}?{operator_name}")
+            # The display name is a synthetic "<file>?<operator>" label, not a
+            # real path, so there is no value in parsing it into a PurePath.
+            if source_file is not None:
+                display_name = f"{source_file}?{operator_name}"
 
             operator = ExpandedOperatorType(
-                self.path / directory_name,
+                path / directory_name,
                 operator_name,
-                write_back=self.write_back,
+                write_back=write_back,
                 source_file=display_name,
             )
 
@@ -302,7 +360,7 @@ class DigitalAssetDirectory(BaseFileItem):
 
         return operators
 
-    def _find_operator_dirs(self) -> List[List[str]]:
+    def _find_operator_dirs(self) -> List[Tuple[str, str]]:
         """Find a list of operator definition directories based on the Sections.list.
 
         :return: A list of any directories containing operator definitions.
@@ -315,17 +373,31 @@ class DigitalAssetDirectory(BaseFileItem):
                 f"Could not find Sections.list in extracted otl folder: {self.path}"
             )
 
-        with sections_list.open() as handle:
-            data = handle.readlines()
+        # Grab the directory names with a single scandir pass so checking
+        # whether a section is a directory is a set lookup instead of a stat
+        # per line.
+        with os.scandir(self.path) as scanner:
+            dir_names = {
+                entry.name for entry in scanner if entry.is_dir(follow_symlinks=False)
+            }
 
         results = []
 
-        for line in data:
-            components = line.split()
+        # Pull the file in with one read; the lines come back without their
+        # trailing newlines.
+        for line in sections_list.read_text().splitlines():
+            # Lines are '<directory>\t<operator name>'.  str.partition grabs
+            # both fields without allocating a token list per line.
+            directory_name, sep, operator_name = line.partition("\t")
 
-            if len(components) == 2:
-                if (self.path / components[0]).is_dir():
-                    results.append(components)
+            if sep:
+                operator_name = operator_name.strip()
+
+                if operator_name and directory_name in dir_names:
+                    # Operator names repeat common namespace prefixes across
+                    # large libraries so interning dedupes the retained
+                    # strings.
+                    results.append((directory_name, sys.intern(operator_name)))
 
         return results
 
@@ -344,10 +416,11 @@ class DigitalAssetDirectory(BaseFileItem):
         """
         operators = self._build_operator_list()
 
-        result = 0
+        # Operators are independent so they can process concurrently when
+        # parallel processing is enabled.
+        result = houdini_package_runner.utils.process_items(operators, runner)
 
         for operator in operators:
-            result |= operator.process(runner)
             self.contents_changed |= operator.contents_changed
 
         return result
@@ -356,6 +429,8 @@ class DigitalAssetDirectory(BaseFileItem):
 class BinaryDigitalAssetFile(BaseFileItem):
     """Class representing a binary digital asset file that will be extracted for testing."""
 
+    __slots__ = ()
+
     # -------------------------------------------------------------------------
     # NON-PUBLIC METHODS
     # -------------------------------------------------------------------------
@@ -401,7 +476,16 @@ class BinaryDigitalAssetFile(BaseFileItem):
         :return: The process return code.
 
         """
-        target_folder = runner.temp_dir / self.path.name
+        # The basename alone is not unique across the discovered items (the
+        # same file name can appear under both otls/ and hda/), so extract
+        # under a subdirectory keyed to this asset's path to keep
+        # concurrently processed assets from sharing an extraction target.
+        target_folder = (
+            houdini_package_runner.utils.get_item_temp_dir(
+                runner.temp_dir, str(self.path)
+            )
+            / self.path.name
+        )
 
         self._extract_file(runner.hotl_command, target_folder)
 
@@ -426,7 +510,7 @@ class BinaryDigitalAssetFile(BaseFileItem):
 # =============================================================================
 
 
-def is_expanded_digital_asset_dir(path: pathlib.Path) -> bool:
+def is_expanded_digital_asset_dir(path: Union[pathlib.Path, str]) -> bool:
     """Check if a folder is an expanded digital asset.
 
     We say a folder is an expanded digital asset if it has a "Sections.list" file inside.
@@ -435,4 +519,5 @@ def is_expanded_digital_asset_dir(path: pathlib.Path) -> bool:
     :return: Whether the folder is an expanded digital asset.
 
     """
-    return (path / "Sections.list").is_file()
+    # A single os.path stat, avoiding the Path construction for the child.
+    return os.path.isfile(os.path.join(path, "Sections.list"))
@@ -9,6 +9,8 @@ from __future__ import annotations
 
 # Standard Library
 import hashlib
+import mmap
+import os
 import pathlib
 from typing import TYPE_CHECKING, List, Optional
 
@@ -21,6 +23,28 @@ if TYPE_CHECKING:
     from houdini_package_runner.items.base import BaseItem
 
 
+# =============================================================================
+# GLOBALS
+# =============================================================================
+
+# Common suffixes which can never be Python scripts, rejected without even
+# opening the file for a shebang probe.
+_NON_PY_SUFFIXES = frozenset(
+    (
+        ".dll",
+        ".dylib",
+        ".json",
+        ".md",
+        ".pyc",
+        ".pyo",
+        ".so",
+        ".txt",
+        ".ui",
+        ".xml",
+    )
+)
+
+
 # =============================================================================
 # CLASSES
 # =============================================================================
@@ -35,6 +59,8 @@ class DirectoryToProcess(BaseFileItem):
 
     """
 
+    __slots__ = ("_traverse_children",)
+
     def __init__(
         self,
         path: pathlib.Path,
@@ -60,31 +86,45 @@ class DirectoryToProcess(BaseFileItem):
         """
         items: List[BaseItem] = []
 
-        for child in pathlib.Path(self.path).iterdir():
-            # Skip hidden items.
-            if not child.name[0].isalpha():
-                continue
+        # Iterate dir entries so is_dir() is answered from the readdir data,
+        # and only build Path objects for entries which become items.
+        with os.scandir(self.path) as scanner:
+            for entry in scanner:
+                # Skip hidden items.
+                if not entry.name[0].isalpha():
+                    continue
+
+                # The default is_dir() still answers from the readdir data
+                # for real directories and only pays a stat for symlinks,
+                # which must follow the link so a linked directory doesn't
+                # fall through to the file branch and get opened as a file.
+                if entry.is_dir():
+                    # If there is an __init__.py file then we can treat the directory as a
+                    # Python package.  A single os.path stat, with no
+                    # intermediate Path construction.
+                    if os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                        items.append(
+                            PythonPackageDirectoryItem(
+                                pathlib.Path(entry.path), write_back=self.write_back
+                            )
+                        )
 
-            if child.is_dir():
-                # If there is an __init__.py file then we can treat the directory as a
-                # Python package.
-                if (child / "__init__.py").exists():
-                    items.append(
-                        PythonPackageDirectoryItem(child, write_back=self.write_back)
-                    )
+                    # Otherwise, it's just another directory.
+                    else:
+                        items.append(
+                            DirectoryToProcess(
+                                pathlib.Path(entry.path),
+                                write_back=self.write_back,
+                                traverse_children=True,
+                            )
+                        )
 
-                # Otherwise, it's just another directory.
                 else:
-                    items.append(
-                        DirectoryToProcess(
-                            child, write_back=self.write_back, traverse_children=True
-                        )
-                    )
+                    child = pathlib.Path(entry.path)
 
-            else:
-                # If the file is a Python file we can process it.
-                if is_python_file(child):
-                    items.append(FileToProcess(child, write_back=self.write_back))
+                    # If the file is a Python file we can process it.
+                    if is_python_file(child):
+                        items.append(FileToProcess(child, write_back=self.write_back))
 
         # If this is a test item then make any found child items also test items.
         if self.is_test_item:
@@ -151,6 +191,8 @@ class FileToProcess(BaseFileItem):
 
     """
 
+    __slots__ = ("_display_name",)
+
     def __init__(
         self, path: pathlib.Path, write_back: bool = False, display_name: str = None
     ) -> None:
@@ -189,6 +231,11 @@ class FileToProcess(BaseFileItem):
         :return: The process return code.
 
         """
+        # Read-only runs never modify the file, so skip the change detection
+        # hashing (two full reads of the file) entirely.
+        if not self.write_back:
+            return runner.process_path(self.path, self)
+
         pre_hash = compute_file_hash(self.path)
         result = runner.process_path(self.path, self)
         post_hash = compute_file_hash(self.path)
@@ -200,10 +247,14 @@ class FileToProcess(BaseFileItem):
 class HoudiniDirectoryItem(DirectoryToProcess):
     """Subclass to represent a directory under a package houdini/ directory."""
 
+    __slots__ = ()
+
 
 class HoudiniScriptsDirectoryItem(DirectoryToProcess):
     """Subclass to represent a scripts/ directory under a package houdini directory."""
 
+    __slots__ = ()
+
     def _get_child_items(self) -> List[BaseItem]:
         """Find child items to process.
 
@@ -224,6 +275,8 @@ class HoudiniScriptsDirectoryItem(DirectoryToProcess):
 class PythonPackageDirectoryItem(DirectoryToProcess):
     """Subclass to represent a directory which is a Python package."""
 
+    __slots__ = ()
+
     def __init__(self, path: pathlib.Path, write_back: bool = False) -> None:
         super().__init__(path, write_back=write_back)
 
@@ -244,15 +297,18 @@ def compute_file_hash(file_path: pathlib.Path) -> str:
 
     """
     with open(file_path, "rb") as handle:
-        file_hash = hashlib.md5()
-        # TODO: Replace with walrus operator once we commit to Python 3.8+.
-        # while chunk := handle.read(8192):
-        chunk = handle.read(8192)
-        while chunk:
-            file_hash.update(chunk)
-            chunk = handle.read(8192)
+        size = os.fstat(handle.fileno()).st_size
+
+        # Zero length files cannot be mapped.
+        if not size:
+            return hashlib.blake2b(digest_size=16).hexdigest()
 
-    return file_hash.hexdigest()
+        # Hash the whole mapping with a single C call instead of streaming
+        # 8KiB chunks through a Python level loop.
+        # The digest is only a change detector, so use BLAKE2b - considerably
+        # cheaper per byte than MD5 - at the same 128 bit output size.
+        with mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) as mapping:
+            return hashlib.blake2b(mapping, digest_size=16).hexdigest()
 
 
 def is_python_file(
@@ -276,23 +332,22 @@ def is_python_file(
     if ext == ".py":
         return True
 
-    if ext == ".pyc":
+    if ext in _NON_PY_SUFFIXES:
         return False
 
-    # Try to peak at the first line.
-    with file_path.open() as handle:
-        try:
-            first_line = handle.readline()
+    # Peek at the head of the file in binary mode; only shebang lines are of
+    # interest and this skips text decoding entirely (binary files previously
+    # had to raise and catch UnicodeDecodeError just to return False).
+    with file_path.open("rb") as handle:
+        head = handle.read(128)
 
-        except UnicodeDecodeError:
-            return False
+    # If the file is a script check if any of the python bin names are in the command.
+    if not head.startswith(b"#!"):
+        return False
 
-    python_bins = ["python"] if python_bins is None else python_bins
+    newline_index = head.find(b"\n")
+    first_line = head[:newline_index] if newline_index != -1 else head
 
-    # If the file is a script check if any of the python bin names are in the command.
-    if first_line.startswith("#!"):
-        for python_bin in python_bins:
-            if python_bin in first_line:
-                return True
+    python_bins = ["python"] if python_bins is None else python_bins
 
-    return False
+    return any(python_bin.encode() in first_line for python_bin in python_bins)
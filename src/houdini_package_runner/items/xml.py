@@ -9,12 +9,16 @@ from __future__ import annotations
 
 # Standard Library
 import abc
-from typing import TYPE_CHECKING, List, Tuple
+import concurrent.futures
+import itertools
+import os
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 # Third Party
 from lxml import etree
 
 # Houdini Package Runner
+import houdini_package_runner.utils
 from houdini_package_runner.items.filesystem import FileToProcess
 
 # Imports for type checking.
@@ -42,6 +46,8 @@ class XMLBase(FileToProcess, metaclass=abc.ABCMeta):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self, path: pathlib.Path, write_back: bool = False, display_name: str = None
     ):
@@ -50,11 +56,29 @@ class XMLBase(FileToProcess, metaclass=abc.ABCMeta):
         # hou and kwargs are always available in menu items.
         self.ignored_builtins.extend(("hou", "kwargs"))
 
+    # The element tag that per-file items are gathered from.
+    _ITEM_TAG: str = ""
+
+    # Compiled search returning the matching item elements of a parsed tree,
+    # set by subclasses.
+    _XP_FIND_ITEMS: etree.XPath
+
     # -------------------------------------------------------------------------
     # NON-PUBLIC METHODS
     # -------------------------------------------------------------------------
 
     @abc.abstractmethod
+    def _get_items_from_element(
+        self,
+        element: etree._Element,  # pylint: disable=protected-access
+    ) -> ItemsToProcess:
+        """Get any items to process from a single matched element.
+
+        :param element: An xml element matching the item tag.
+        :return: A list of items to be processed.
+
+        """
+
     def _get_items_to_process(
         self,
         root: etree._Element,  # pylint: disable=protected-access
@@ -65,6 +89,14 @@ class XMLBase(FileToProcess, metaclass=abc.ABCMeta):
         :return: A list of items to be processed.
 
         """
+        items: ItemsToProcess = []
+
+        # The compiled search runs entirely in C rather than surfacing every
+        # document node to Python the way root.iter() does.
+        for element in self._XP_FIND_ITEMS(root):
+            items.extend(self._get_items_from_element(element))
+
+        return items
 
     def _handle_write_back(
         self,
@@ -81,51 +113,129 @@ class XMLBase(FileToProcess, metaclass=abc.ABCMeta):
         # Stash the pre-updated text.
         script_code = section.text
 
-        # Read the possibly modified file.
-        with temp_path.open("r") as handle:
-            contents = handle.read()
+        # Read the possibly modified file with a single read_text call.
+        contents = temp_path.read_text()
+
+        # Nothing was modified (the common case for reporting-only tools), so
+        # skip the CDATA probe and text node rebuild entirely.
+        if contents == script_code:
+            return
 
         # Check if the code blob is in a CDATA block.  If the original code was in
         # a CDATA block, wrap the result in one and set it
-        # back to the section.
-        if "CDATA" in etree.tostring(section, encoding="unicode"):
+        # back to the section.  Serialize to bytes without the tail so the
+        # probe skips the unicode decode and any trailing document text.
+        if b"<![CDATA[" in etree.tostring(section, with_tail=False):
             section.text = etree.CDATA(contents)
 
         # Otherwise, just use the raw values.
         else:
             section.text = contents
 
-        if section.text != script_code:
-            self.contents_changed = True
+        self.contents_changed = True
 
-    def _process_code_section(
+    def _process_sections_parallel(
         self,
-        section: etree._Element,  # pylint: disable=protected-access
         runner: HoudiniPackageRunner,
-        base_file_name: str,
+        items_to_process: ItemsToProcess,
     ) -> int:
-        """Process an XML section's text.
+        """Process sections concurrently, applying write back serially.
+
+        The subprocess bound checking can run concurrently; the tree mutation
+        must stay serial as lxml element mutation is not thread safe.
 
-        :param section: The section to process.
         :param runner: The package runner processing the item.
-        :param base_file_name: The name of the temporary file.
-        :return: The process return code.
+        :param items_to_process: The section items to process.
+        :return: The combined process return code.
 
         """
-        # Create a temp Python file for the code blob.
-        temp_path = runner.temp_dir / f"{base_file_name}.py"
+        temp_paths = [
+            self._write_code_section(section, runner, base_file_name)
+            for section, base_file_name in items_to_process
+        ]
 
-        # Dump the code to the temp file, so it can be processed.
-        with temp_path.open("w") as handle:
-            handle.write(str(section.text))
+        result = 0
 
-        result = runner.process_path(temp_path, self)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            for item_result in executor.map(
+                runner.process_path, temp_paths, itertools.repeat(self)
+            ):
+                result |= item_result
+
+        for item, temp_path in zip(items_to_process, temp_paths):
+            self._handle_write_back(item[0], temp_path)
+
+        return result
+
+    def _process_sections_serial(
+        self,
+        runner: HoudiniPackageRunner,
+        items_to_process: ItemsToProcess,
+    ) -> int:
+        """Process sections one at a time, deduplicating identical bodies.
+
+        Identical script bodies - usually repeated boilerplate - only need to
+        be checked once; the write back is applied to every duplicate from
+        the shared temp file.
+
+        :param runner: The package runner processing the item.
+        :param items_to_process: The section items to process.
+        :return: The combined process return code.
+
+        """
+        result = 0
+
+        seen: Dict[str, pathlib.Path] = {}
+
+        for section, base_file_name in items_to_process:
+            body = str(section.text)
+
+            temp_path = seen.get(body)
+
+            if temp_path is None:
+                temp_path = self._write_code_section(section, runner, base_file_name)
+
+                result |= runner.process_path(temp_path, self)
+
+                seen[body] = temp_path
 
-        if self.write_back:
             self._handle_write_back(section, temp_path)
 
         return result
 
+    def _write_code_section(
+        self,
+        section: etree._Element,  # pylint: disable=protected-access
+        runner: HoudiniPackageRunner,
+        base_file_name: str,
+    ) -> pathlib.Path:
+        """Write an XML section's text to a temp file for processing.
+
+        :param section: The section to write.
+        :param runner: The package runner processing the item.
+        :param base_file_name: The name of the temporary file.
+        :return: The written temp file path.
+
+        """
+        # Create a temp Python file for the code blob.  The base name is only
+        # unique within this document (tool/item names can repeat between
+        # files), so write under a subdirectory keyed to this file's path to
+        # keep concurrently processed items from sharing temp paths.
+        temp_path = (
+            houdini_package_runner.utils.get_item_temp_dir(
+                runner.temp_dir, str(self.path)
+            )
+            / f"{base_file_name}.py"
+        )
+
+        # Dump the code to the temp file, so it can be processed.  write_text
+        # is one open/write/close cycle rather than three separate steps.
+        temp_path.write_text(str(section.text))
+
+        return temp_path
+
     # -------------------------------------------------------------------------
     # METHODS
     # -------------------------------------------------------------------------
@@ -137,20 +247,62 @@ class XMLBase(FileToProcess, metaclass=abc.ABCMeta):
         :return: The process return code.
 
         """
-        parser = etree.XMLParser(strip_cdata=False)
-        tree = etree.parse(str(self.path), parser)
-
-        root = tree.getroot()
-
-        items_to_process = self._get_items_to_process(root)
-
         result = 0
 
-        for item in items_to_process:
-            result |= self._process_code_section(item[0], runner, item[1])
+        # Convert the path once for the parse and write calls below.
+        path_str = str(self.path)
+
+        if self.write_back:
+            # Writing back requires the full document so it can be
+            # reserialized after the sections are updated.
+            parser = etree.XMLParser(
+                strip_cdata=False,
+                collect_ids=False,
+                resolve_entities=False,
+                huge_tree=True,
+            )
+            tree = etree.parse(path_str, parser)
+
+            items_to_process = self._get_items_to_process(tree.getroot())
+
+            if runner.parallel and len(items_to_process) > 1:
+                result = self._process_sections_parallel(runner, items_to_process)
+
+            else:
+                result = self._process_sections_serial(runner, items_to_process)
+
+            if self.contents_changed:
+                # Serialize through an explicitly buffered handle so lxml
+                # writes into a large userspace buffer instead of many small
+                # file writes.
+                with open(path_str, "wb", buffering=1 << 20) as handle:
+                    tree.write(handle, encoding="utf-8", xml_declaration=True)
 
-        if self.write_back and self.contents_changed:
-            tree.write(str(self.path), encoding="utf-8", xml_declaration=True)
+        else:
+            # Read-only runs stream the document with iterparse, clearing each
+            # element once processed so only ~one subtree is held in memory.
+            # With no write back to interleave, the temp files can all be
+            # written up front and handed to the runner as one batch.
+            temp_paths = []
+
+            for _, element in etree.iterparse(
+                path_str,
+                events=("end",),
+                tag=self._ITEM_TAG,
+                strip_cdata=False,
+                collect_ids=False,
+                resolve_entities=False,
+                huge_tree=True,
+            ):
+                for section, base_file_name in self._get_items_from_element(element):
+                    temp_paths.append(
+                        self._write_code_section(section, runner, base_file_name)
+                    )
+
+                element.clear(keep_tail=True)
+
+            if temp_paths:
+                result = runner.process_paths(temp_paths, self)
 
         return result
 
@@ -158,35 +310,49 @@ class XMLBase(FileToProcess, metaclass=abc.ABCMeta):
 class MenuFile(XMLBase):
     """An xml menu file."""
 
+    __slots__ = ()
+
+    _ITEM_TAG = "scriptItem"
+
+    # scriptItem entries can be nested under submenus so search descendants.
+    _XP_FIND_ITEMS = etree.XPath(".//scriptItem", smart_strings=False)
+
+    # Precompiled lookups, shared by all instances to avoid re-parsing the
+    # path expressions on every element.
+    _XP_SCRIPT_CODE = etree.XPath("scriptCode", smart_strings=False)
+    _XP_CONTEXT_EXPRESSION = etree.XPath("context/expression", smart_strings=False)
+
     # -------------------------------------------------------------------------
     # NON-PUBLIC METHODS
     # -------------------------------------------------------------------------
 
-    def _get_items_to_process(
+    def _get_items_from_element(
         self,
-        root: etree._Element,  # pylint: disable=protected-access
+        element: etree._Element,  # pylint: disable=protected-access
     ) -> ItemsToProcess:
-        """Get any xml items that need to be processed.
+        """Get any items to process from a single matched element.
 
-        For XML menu files we look for 'scriptItem' entries and attempt to
+        For XML menu files we look at 'scriptItem' entries and attempt to
         grab their 'scriptCode' and 'context/expression' contents.
 
-        :param root: An xml element.
+        :param element: An xml element matching the item tag.
         :return: A list of items to be processed.
 
         """
         items = []
 
-        for script_item in root.iter(tag="scriptItem"):
-            code = script_item.find("scriptCode")
+        found = self._XP_SCRIPT_CODE(element)
 
-            if code is not None:
-                items.append((code, str(script_item.attrib["id"])))
+        if found:
+            # Grab the id once for both the item and its context name.
+            item_id = str(element.attrib["id"])
 
-                context = script_item.find("context/expression")
+            items.append((found[0], item_id))
 
-                if context is not None:
-                    items.append((context, f"{script_item.get('id'):s}.context"))
+            context = self._XP_CONTEXT_EXPRESSION(element)
+
+            if context:
+                items.append((context[0], item_id + ".context"))
 
         return items
 
@@ -194,31 +360,36 @@ class MenuFile(XMLBase):
 class PythonPanelFile(XMLBase):
     """A python panel file."""
 
+    __slots__ = ()
+
+    _ITEM_TAG = "interface"
+
+    _XP_FIND_ITEMS = etree.XPath("interface", smart_strings=False)
+
+    # Precompiled lookup, shared by all instances to avoid re-parsing the
+    # path expression on every element.
+    _XP_SCRIPT = etree.XPath("script", smart_strings=False)
+
     # -------------------------------------------------------------------------
     # NON-PUBLIC METHODS
     # -------------------------------------------------------------------------
 
-    def _get_items_to_process(
+    def _get_items_from_element(
         self,
-        root: etree._Element,  # pylint: disable=protected-access
+        element: etree._Element,  # pylint: disable=protected-access
     ) -> ItemsToProcess:
-        """Get any xml items that need to be processed.
+        """Get any items to process from a single matched element.
 
-        :param root: An xml element.
+        :param element: An xml element matching the item tag.
         :return: A list of items to be processed.
 
         """
-        items = []
-
-        for interface in root:
-            script = interface.find("script")
+        found = self._XP_SCRIPT(element)
 
-            if script is None:
-                continue
+        if not found:
+            return []
 
-            items.append((script, str(interface.attrib["name"])))
-
-        return items
+        return [(found[0], str(element.attrib["name"]))]
 
 
 class ShelfFile(XMLBase):
@@ -231,6 +402,16 @@ class ShelfFile(XMLBase):
 
     """
 
+    __slots__ = ("_tool_name",)
+
+    _ITEM_TAG = "tool"
+
+    _XP_FIND_ITEMS = etree.XPath("tool", smart_strings=False)
+
+    # Precompiled lookup, shared by all instances to avoid re-parsing the
+    # path expression on every element.
+    _XP_SCRIPT = etree.XPath("script", smart_strings=False)
+
     def __init__(
         self,
         path: pathlib.Path,
@@ -246,37 +427,33 @@ class ShelfFile(XMLBase):
     # NON-PUBLIC METHODS
     # -------------------------------------------------------------------------
 
-    def _get_items_to_process(
+    def _get_items_from_element(
         self,
-        root: etree._Element,  # pylint: disable=protected-access
+        element: etree._Element,  # pylint: disable=protected-access
     ) -> ItemsToProcess:
-        """Get any xml items that need to be processed.
+        """Get any items to process from a single matched element.
 
-        :param root: An xml element.
+        :param element: An xml element matching the item tag.
         :return: A list of items to be processed.
 
         """
-        items = []
+        found = self._XP_SCRIPT(element)
 
-        for tool in root:
-            script = tool.find("script")
+        if not found:
+            return []
 
-            if script is None:
-                continue
+        script = found[0]
 
-            language = script.get("scriptType")
+        language = script.get("scriptType")
 
-            if language != "python":
-                continue
+        if language != "python":
+            return []
 
-            tool_name = str(tool.attrib["name"])
+        tool_name = str(element.attrib["name"])
 
-            if tool_name == "$HDA_DEFAULT_TOOL" and self._tool_name is not None:
-                tool_name = (
-                    self._tool_name.replace("::", "__").replace("/", "_")
-                    + "_DEFAULT_TOOL"
-                )
+        if tool_name == "$HDA_DEFAULT_TOOL" and self._tool_name is not None:
+            tool_name = (
+                self._tool_name.replace("::", "__").replace("/", "_") + "_DEFAULT_TOOL"
+            )
 
-            items.append((script, tool_name))
-
-        return items
+        return [(script, tool_name)]
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 # Standard Library
 import argparse
+import os
 import pathlib
 from typing import List, Tuple
 
@@ -173,6 +174,18 @@ def build_common_parser(
         help="Skip processing of files under {root}/tests.",
     )
 
+    parser.add_argument(
+        "--temp-dir",
+        action="store",
+        help="Optional base directory to create runner temp files under.",
+    )
+
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Process items in parallel where supported.",
+    )
+
     parser.add_argument(
         "--list-items",
         action="store_true",
@@ -199,13 +212,23 @@ def process_common_arg_settings(
 
     houdini_root = _resolve_houdini_root(parsed_args, root)
 
-    extra_paths = [root / dir_name for dir_name in parsed_args.directories]
+    # Join the extra paths as strings and wrap them once, rather than paying
+    # for a parsed Path join per entry.
+    root_str = os.fspath(root)
+
+    extra_paths = [
+        pathlib.Path(os.path.join(root_str, dir_name))
+        for dir_name in parsed_args.directories
+    ]
 
     extra_paths.extend(_resolve_python_packages(parsed_args, root))
 
     extra_paths.extend(_resolve_tests(parsed_args, root))
 
-    extra_paths.extend([root / file_name for file_name in parsed_args.files])
+    extra_paths.extend(
+        pathlib.Path(os.path.join(root_str, file_name))
+        for file_name in parsed_args.files
+    )
 
     houdini_items = parsed_args.houdini_items.split(",")
 
@@ -5,11 +5,13 @@ from __future__ import annotations
 
 # Standard Library
 import abc
+import os
 import pathlib
 import tempfile
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 # Houdini Package Runner
+import houdini_package_runner.utils
 from houdini_package_runner.config import PackageRunnerConfig
 
 # Imports for type checking.
@@ -45,7 +47,8 @@ class HoudiniPackageRunner(abc.ABC):
         self._extra_args: List[str] = []
         self._hotl_command = "hotl"
         self._list_items = False
-        self._temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self._parallel = False
+        self._temp_dir = pathlib.Path(tempfile.mkdtemp(dir=_get_temp_dir_base()))
         self._verbose = False
         self._write_back = write_back
 
@@ -83,6 +86,11 @@ class HoudiniPackageRunner(abc.ABC):
     def name(self) -> str:
         """The runner name used for identification."""
 
+    @property
+    def parallel(self) -> bool:
+        """Whether items may be processed in parallel."""
+        return self._parallel
+
     @property
     def temp_dir(self) -> pathlib.Path:
         """The temp directory used by the package runner."""
@@ -112,6 +120,25 @@ class HoudiniPackageRunner(abc.ABC):
 
         """
 
+    def process_paths(self, file_paths: List[pathlib.Path], item: BaseItem) -> int:
+        """Process multiple file paths for an item.
+
+        By default each path is processed individually.  Runners whose tool
+        accepts multiple paths per execution can override this to amortize
+        their startup cost across the batch.
+
+        :param file_paths: The paths to process.
+        :param item: The item to process.
+        :return: The combined process return code.
+
+        """
+        result = 0
+
+        for file_path in file_paths:
+            result |= self.process_path(file_path, item)
+
+        return result
+
     def init_args_options(
         self, namespace: argparse.Namespace, extra_args: List[str]
     ):  # pylint: disable=unused-argument
@@ -127,6 +154,12 @@ class HoudiniPackageRunner(abc.ABC):
         if hasattr(namespace, "hotl_command"):
             self._hotl_command = namespace.hotl_command
 
+        if hasattr(namespace, "parallel"):
+            self._parallel = namespace.parallel
+
+        if getattr(namespace, "temp_dir", None):
+            self._temp_dir = pathlib.Path(tempfile.mkdtemp(dir=namespace.temp_dir))
+
     def run(self) -> int:
         """Process all the items.
 
@@ -139,12 +172,32 @@ class HoudiniPackageRunner(abc.ABC):
 
             return 0
 
-        result = 0
-
-        for item in self.discoverer.items:
-            if self.write_back:
+        if self.write_back:
+            for item in self.discoverer.items:
                 item.write_back = True
 
-            result |= item.process(self)
+        # Processing the top level items in parallel lets expensive per-item
+        # work such as digital asset extraction overlap.
+        return houdini_package_runner.utils.process_items(self.discoverer.items, self)
 
-        return result
+
+# =============================================================================
+# NON-PUBLIC FUNCTIONS
+# =============================================================================
+
+
+def _get_temp_dir_base() -> Optional[str]:
+    """Find the preferred base directory for runner temp files.
+
+    On Linux /dev/shm is RAM backed, which keeps the many per-section temp
+    file round trips out of real disk I/O.
+
+    :return: The base directory to create the temp dir under, if any.
+
+    """
+    shm_path = "/dev/shm"
+
+    if os.path.isdir(shm_path) and os.access(shm_path, os.W_OK):
+        return shm_path
+
+    return None
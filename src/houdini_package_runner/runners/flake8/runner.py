@@ -9,7 +9,7 @@ from __future__ import annotations
 
 # Standard Library
 import pathlib
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 # Houdini Package Runner
 import houdini_package_runner.parser
@@ -43,9 +43,13 @@ class Flake8Runner(HoudiniPackageRunner):
     def __init__(
         self, discoverer: BaseItemDiscoverer, runner_config: BaseRunnerConfig = None
     ) -> None:
-        super().__init__(discoverer, write_back=True, runner_config=runner_config)
+        # flake8 only ever reports problems, so don't mark the runner as
+        # writing back.  This lets items skip their write-back round trips
+        # (temp file readbacks, XML rewraps, asset re-collapsing checks).
+        super().__init__(discoverer, runner_config=runner_config)
 
         self._ignored: List[str] = []
+        self._ignored_str = ""
 
     # -------------------------------------------------------------------------
     # PROPERTIES
@@ -101,28 +105,29 @@ Any unknown args will be passed along to the flake8 command.
         if namespace.ignore:
             self._ignored = namespace.ignore.split(",")
 
+            # Precompute the joined flag value for the common case where no
+            # per-item codes get added.
+            self._ignored_str = namespace.ignore
+
         self._extra_args = extra_args
 
-    def process_path(self, file_path: pathlib.Path, item: BaseItem) -> int:
-        """Process a file path.
+    def _build_command(self, file_path: pathlib.Path, item: BaseItem) -> List[str]:
+        """Build the flake8 command for a file path, without the path itself.
 
         :param file_path: The path to format.
         :param item: The item to format.
-        :return: The process return code.
+        :return: The command flag list.
 
         """
         command = [
             "flake8",
         ]
 
-        to_ignore = []
+        # Copy so extending with config data doesn't mutate (and grow) the
+        # item's own builtin list across repeated calls.
+        known_builtins: List[str] = list(item.ignored_builtins)
 
-        if self._ignored:
-            to_ignore.extend(self._ignored)
-
-        known_builtins: List[str] = item.ignored_builtins
-
-        to_ignore.extend(self.config.get_config_data("to_ignore", item, file_path))
+        config_ignored = self.config.get_config_data("to_ignore", item, file_path)
 
         command.extend(self.config.get_config_data("command", item, file_path))
 
@@ -135,13 +140,28 @@ Any unknown args will be passed along to the flake8 command.
                 command, "--builtins", known_builtins
             )
 
-        if to_ignore:
-            command.append(f"--ignore={','.join(to_ignore)}")
+        # Only join the codes when per-item ones are present, otherwise reuse
+        # the string precomputed at option init time.
+        if config_ignored:
+            command.append(f"--ignore={','.join(self._ignored + config_ignored)}")
+
+        elif self._ignored:
+            command.append(f"--ignore={self._ignored_str}")
 
         command.extend(self.extra_args)
 
         # Remove any duplicate items that could result in unexpected behavior.
-        command = houdini_package_runner.utils.remove_duplicate_flags(command)
+        return houdini_package_runner.utils.remove_duplicate_flags(command)
+
+    def process_path(self, file_path: pathlib.Path, item: BaseItem) -> int:
+        """Process a file path.
+
+        :param file_path: The path to format.
+        :param item: The item to format.
+        :return: The process return code.
+
+        """
+        command = self._build_command(file_path, item)
 
         command.append(str(file_path))
 
@@ -152,6 +172,38 @@ Any unknown args will be passed along to the flake8 command.
             command, verbose=self.verbose
         )
 
+    def process_paths(self, file_paths: List[pathlib.Path], item: BaseItem) -> int:
+        """Process multiple file paths for an item.
+
+        flake8 accepts any number of paths per invocation, so the paths are
+        grouped by their computed flag sets and each group is checked with a
+        single subprocess, amortizing the interpreter and plugin startup.
+
+        :param file_paths: The paths to process.
+        :param item: The item to process.
+        :return: The combined process return code.
+
+        """
+        groups: Dict[Tuple[str, ...], List[str]] = {}
+
+        for file_path in file_paths:
+            flags = tuple(self._build_command(file_path, item))
+            groups.setdefault(flags, []).append(str(file_path))
+
+        result = 0
+
+        for flags, paths in groups.items():
+            command = list(flags) + paths
+
+            if self.verbose:
+                houdini_package_runner.runners.utils.print_runner_command(item, command)
+
+            result |= houdini_package_runner.utils.execute_subprocess_command(
+                command, verbose=self.verbose
+            )
+
+        return result
+
 
 # =============================================================================
 # FUNCTIONS
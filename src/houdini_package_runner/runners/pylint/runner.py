@@ -53,6 +53,9 @@ class PyLintRunner(HoudiniPackageRunner):
 
         self._disabled: List[str] = []
 
+        # Pooled output buffer, reused across process_path calls.
+        self._output_buf = StringIO()
+
     # -------------------------------------------------------------------------
     # PROPERTIES
     # -------------------------------------------------------------------------
@@ -101,6 +104,10 @@ Any unknown args will be passed along to the pylint command.
         """
         super().init_args_options(namespace, extra_args)
 
+        # pylint executes in-process via lint.Run, and neither it nor the
+        # pooled output buffer is thread safe, so never process in parallel.
+        self._parallel = False
+
         if namespace.rcfile:
             extra_args.insert(0, f"--rcfile={namespace.rcfile}")
 
@@ -131,7 +138,9 @@ Any unknown args will be passed along to the pylint command.
 
         flags.extend(self.config.get_config_data("command", item, file_path))
 
-        known_builtins: List[str] = item.ignored_builtins
+        # Copy so extending with config data doesn't mutate (and grow) the
+        # item's own builtin list across repeated calls.
+        known_builtins: List[str] = list(item.ignored_builtins)
 
         known_builtins.extend(
             self.config.get_config_data("known_builtins", item, file_path)
@@ -145,16 +154,22 @@ Any unknown args will be passed along to the pylint command.
         if to_disable:
             flags.append(f"--disable={','.join(to_disable)}")
 
-        command = flags + [str(file_path)]
+        # Append the path in place rather than building another list.
+        flags.append(str(file_path))
 
         if self.verbose:
             houdini_package_runner.runners.utils.print_runner_command(
-                item, command, extra="pylint --output-format=colorized "
+                item, flags, extra="pylint --output-format=colorized "
             )
 
-        buf = StringIO()
+        # Reuse the pooled buffer rather than constructing a fresh one per
+        # file.  pylint already runs in-process here, so astroid's module
+        # caches stay warm between calls for free.
+        buf = self._output_buf
+        buf.seek(0)
+        buf.truncate()
 
-        result = lint.Run(command, reporter=ColorizedTextReporter(buf), exit=False)
+        result = lint.Run(flags, reporter=ColorizedTextReporter(buf), exit=False)
 
         output = buf.getvalue()
 
@@ -4,10 +4,23 @@
 # IMPORTS
 # =============================================================================
 
+# Future
+from __future__ import annotations
+
 # Standard Library
+import concurrent.futures
+import hashlib
+import operator
 import os
+import pathlib
 import subprocess
-from typing import List, Optional
+import tempfile
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+# Imports for type checking.
+if TYPE_CHECKING:
+    from houdini_package_runner.items.base import BaseItem
+    from houdini_package_runner.runners.base import HoudiniPackageRunner
 
 # =============================================================================
 # FUNCTIONS
@@ -44,34 +57,92 @@ def execute_subprocess_command(command: List[str], verbose: bool = False) -> int
     :return: The subprocess return code.
 
     """
-    # If verbose mode is turned on then we don't want to capture the output.
-    # so we'll set the output pipe to be None, otherwise we'll capture it.
-    output_pipe = None if verbose else subprocess.PIPE
-
-    env = os.environ.copy()
+    env = None
 
     # Remove PYTHONHOME from the env if it exists. This can cause problems for subprocesses
-    # being executed from within Houdini.
-    if "PYTHONHOME" in env:
+    # being executed from within Houdini.  Only pay for the environment copy
+    # when it is actually set; otherwise let the child inherit directly.
+    if "PYTHONHOME" in os.environ:
+        env = os.environ.copy()
         del env["PYTHONHOME"]
 
-    with subprocess.Popen(
-        command, stdout=output_pipe, stderr=output_pipe, env=env
-    ) as proc:
-        proc.wait()
+    # If verbose mode is turned on then we don't want to capture the output.
+    if verbose:
+        with subprocess.Popen(command, env=env) as proc:
+            proc.wait()
+
+            return proc.returncode
+
+    # Capture output into an unlinked temp file rather than OS pipes.  The
+    # child writes straight into it (no pipe buffers to drain, so no deadlock
+    # risk) and nothing is read back at all on the success path.  A spooled
+    # file would not help here: handing it to the child forces a rollover to
+    # a real file descriptor anyway.
+    with tempfile.TemporaryFile() as output_handle:
+        with subprocess.Popen(
+            command, stdout=output_handle, stderr=subprocess.STDOUT, env=env
+        ) as proc:
+            proc.wait()
+
+            return_code = proc.returncode
+
+        if return_code:
+            output_handle.seek(0)
+            output = output_handle.read()
+
+            if output:  # pragma: no branch
+                print(output.decode("utf-8").rstrip())
+
+    return return_code
+
+
+def get_item_temp_dir(temp_dir: pathlib.Path, token: str) -> pathlib.Path:
+    """Get a temp subdirectory unique to an item.
 
-        return_code = proc.returncode
+    Temp file names are only unique within a single item, so items which may
+    process concurrently each write under their own subdirectory, keyed on an
+    identifying token such as the item's source path.
 
-        if return_code and not verbose:
-            if proc.stdout is not None:  # pragma: no branch
-                for line in proc.stdout.readlines():
-                    print(line.decode("utf-8").rstrip())
+    :param temp_dir: The runner temp directory.
+    :param token: A string identifying the item.
+    :return: The created item specific temp directory.
 
-            if proc.stderr is not None:  # pragma: no branch
-                for line in proc.stderr.readlines():
-                    print(line.decode("utf-8").rstrip())
+    """
+    item_dir = temp_dir / hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+
+    item_dir.mkdir(exist_ok=True)
+
+    return item_dir
+
+
+def process_items(items: Sequence[BaseItem], runner: HoudiniPackageRunner) -> int:
+    """Process a list of items with a runner.
+
+    If the runner has parallel processing enabled the items are processed
+    concurrently with a thread pool.  The per-item work is dominated by
+    subprocess execution and file I/O so threads are able to overlap it.
+
+    :param items: The items to process.
+    :param runner: The package runner processing the items.
+    :return: The combined process return code.
+
+    """
+    result = 0
+
+    if runner.parallel and len(items) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            for item_result in executor.map(
+                operator.methodcaller("process", runner), items
+            ):
+                result |= item_result
+
+    else:
+        for item in items:
+            result |= item.process(runner)
 
-        return return_code
+    return result
 
 
 def remove_duplicate_flags(
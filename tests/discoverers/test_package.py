@@ -29,13 +29,12 @@ class TestPackageItemDiscoverer:
     # Object construction
 
     @pytest.mark.parametrize("has_items", (False, True))
-    def test___init__(self, mocker, has_items):
+    def test___init__(self, mocker, tmp_path, has_items):
         """Test object initialization."""
         mock_path = mocker.MagicMock(spec=pathlib.Path)
 
-        mock_file_path = mocker.MagicMock(spec=pathlib.Path)
-        mock_file_path.is_file.return_value = True
-        mock_file_path.is_dir.return_value = False
+        file_path = tmp_path / "some_file"
+        file_path.touch()
 
         mock_file1 = mocker.MagicMock(
             spec=houdini_package_runner.items.filesystem.FileToProcess
@@ -67,15 +66,13 @@ class TestPackageItemDiscoverer:
 
             houdini_items = ["scripts"]
 
-            mock_dir1 = mocker.MagicMock(spec=pathlib.Path)
-            mock_dir1.is_file.return_value = False
-            mock_dir1.is_dir.return_value = True
+            dir_path1 = tmp_path / "dir1"
+            dir_path1.mkdir()
 
-            mock_dir2 = mocker.MagicMock(spec=pathlib.Path)
-            mock_dir2.is_file.return_value = False
-            mock_dir2.is_dir.return_value = True
+            dir_path2 = tmp_path / "dir2"
+            dir_path2.mkdir()
 
-            extra_paths = [mock_file_path, mock_dir1, mock_dir2]
+            extra_paths = [file_path, dir_path1, dir_path2]
 
             inst = houdini_package_runner.discoverers.package.PackageItemDiscoverer(
                 mock_path,
@@ -91,7 +88,7 @@ class TestPackageItemDiscoverer:
                 mock_dir,
             ]
 
-            mock_file_to_process.assert_called_with(mock_file_path)
+            mock_file_to_process.assert_called_with(file_path)
             mock_get_houdini.assert_called_with(houdini_items, inst.path)
 
         else:
@@ -129,6 +126,17 @@ def test_get_digital_asset_items(shared_datadir):
             )
 
 
+def test_get_houdini_items_missing_root(shared_datadir):
+    """Test houdini_package_runner.discoverers.package.get_houdini_items with a missing root."""
+    items = list(
+        houdini_package_runner.discoverers.package.get_houdini_items(
+            ["otls"], shared_datadir / "missing"
+        )
+    )
+
+    assert items == []
+
+
 def test_get_houdini_items(mocker, shared_datadir):
     """Test houdini_package_runner.discoverers.package.get_houdini_items."""
     mock_asset_item = mocker.MagicMock(
@@ -187,8 +195,10 @@ def test_get_houdini_items(mocker, shared_datadir):
         "some_file",
     ]
 
-    items = houdini_package_runner.discoverers.package.get_houdini_items(
-        item_names, test_path
+    items = list(
+        houdini_package_runner.discoverers.package.get_houdini_items(
+            item_names, test_path
+        )
     )
 
     expected = [
@@ -219,61 +229,62 @@ def test_get_houdini_items(mocker, shared_datadir):
     )
 
 
-def test_get_menu_items(mocker):
+def test_get_menu_items(shared_datadir):
     """Test houdini_package_runner.discoverers.package.get_menu_items."""
-    mock_menu_file = mocker.patch("houdini_package_runner.items.xml.MenuFile")
+    test_path = shared_datadir / "get_menu_items"
 
-    mock_menu_path = mocker.MagicMock(spec=pathlib.Path)
+    result = houdini_package_runner.discoverers.package.get_menu_items(test_path)
 
-    mock_houdini_root = mocker.MagicMock(spec=pathlib.Path)
-    mock_houdini_root.glob.return_value = [mock_menu_path]
+    assert len(result) == 1
 
-    result = houdini_package_runner.discoverers.package.get_menu_items(
-        mock_houdini_root
-    )
+    assert isinstance(result[0], houdini_package_runner.items.xml.MenuFile)
+    assert result[0].path == test_path / "MainMenuCommon.xml"
 
-    assert result == [mock_menu_file.return_value]
-
-    mock_houdini_root.glob.assert_called_with("*.xml")
-    mock_menu_file.assert_called_with(mock_menu_path)
+    # A missing directory should still result in an empty item list.
+    assert (
+        houdini_package_runner.discoverers.package.get_menu_items(test_path / "missing")
+        == []
+    )
 
 
-def test_get_python_panel_items(mocker):
+def test_get_python_panel_items(shared_datadir):
     """Test houdini_package_runner.discoverers.package.get_python_panel_items."""
-    mock_panel_file = mocker.patch("houdini_package_runner.items.xml.PythonPanelFile")
-
-    mock_panel_path = mocker.MagicMock(spec=pathlib.Path)
-
-    mock_panel_root = mocker.MagicMock(spec=pathlib.Path)
-    mock_panel_root.glob.return_value = [mock_panel_path]
+    test_path = shared_datadir / "get_python_panel_items"
 
     result = houdini_package_runner.discoverers.package.get_python_panel_items(
-        mock_panel_root
+        test_path
     )
 
-    assert result == [mock_panel_file.return_value]
+    assert len(result) == 1
 
-    mock_panel_root.glob.assert_called_with("*.pypanel")
-    mock_panel_file.assert_called_with(mock_panel_path)
+    assert isinstance(result[0], houdini_package_runner.items.xml.PythonPanelFile)
+    assert result[0].path == test_path / "panel.pypanel"
 
+    # A missing directory should still result in an empty item list.
+    assert (
+        houdini_package_runner.discoverers.package.get_python_panel_items(
+            test_path / "missing"
+        )
+        == []
+    )
 
-def test_get_tool_items(mocker):
-    """Test houdini_package_runner.discoverers.package.get_tool_items."""
-    mock_shelf_file = mocker.patch("houdini_package_runner.items.xml.ShelfFile")
 
-    mock_shelf_path = mocker.MagicMock(spec=pathlib.Path)
+def test_get_tool_items(shared_datadir):
+    """Test houdini_package_runner.discoverers.package.get_tool_items."""
+    test_path = shared_datadir / "get_tool_items"
 
-    mock_toolbar_path = mocker.MagicMock(spec=pathlib.Path)
-    mock_toolbar_path.glob.return_value = [mock_shelf_path]
+    result = houdini_package_runner.discoverers.package.get_tool_items(test_path)
 
-    result = houdini_package_runner.discoverers.package.get_tool_items(
-        mock_toolbar_path
-    )
+    assert len(result) == 1
 
-    assert result == [mock_shelf_file.return_value]
+    assert isinstance(result[0], houdini_package_runner.items.xml.ShelfFile)
+    assert result[0].path == test_path / "default.shelf"
 
-    mock_toolbar_path.glob.assert_called_with("*.shelf")
-    mock_shelf_file.assert_called_with(mock_shelf_path)
+    # A missing directory should still result in an empty item list.
+    assert (
+        houdini_package_runner.discoverers.package.get_tool_items(test_path / "missing")
+        == []
+    )
 
 
 def test_init_standard_package_discoverer(
@@ -86,10 +86,7 @@ class TestDialogScriptItem:
 
         mock_contents = mocker.MagicMock(spec=str)
 
-        mock_handle = mocker.mock_open()
-        mock_handle.return_value.read.return_value = mock_contents
-
-        mock_path.open = mock_handle
+        mock_path.read_text.return_value = mock_contents
 
         mock_super_init = mocker.patch.object(
             houdini_package_runner.items.base.BaseFileItem, "__init__"
@@ -119,9 +116,13 @@ class TestDialogScriptItem:
             assert inst._source_file == mock_source_file
 
         assert inst._name == mock_name
+
+        # The contents should only be read on first access.
+        mock_path.read_text.assert_not_called()
+
         assert inst._ds_contents == mock_contents
 
-        mock_handle.assert_called_with(encoding="utf-8")
+        mock_path.read_text.assert_called_with(encoding="utf-8")
 
     @pytest.mark.parametrize(
         "write_back, test_file",
@@ -141,24 +142,14 @@ class TestDialogScriptItem:
         else:
             contents = ""
 
-        mock_callbacks = [mocker.MagicMock(), mocker.MagicMock()]
-        mock_expressions = [mocker.MagicMock()]
-        mock_menus = [mocker.MagicMock(), mocker.MagicMock()]
+        mock_items = [mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock()]
 
-        for item in tuple(mock_callbacks + mock_expressions + mock_menus):
+        for item in mock_items:
             item.write_back = False
 
-        mock_get_callbacks = mocker.patch(
-            "houdini_package_runner.items.dialog_script._get_callback_items",
-            return_value=mock_callbacks,
-        )
-        mock_get_expressions = mocker.patch(
-            "houdini_package_runner.items.dialog_script._get_expression_items",
-            return_value=mock_expressions,
-        )
-        mock_get_menus = mocker.patch(
-            "houdini_package_runner.items.dialog_script._get_menu_items",
-            return_value=mock_menus,
+        mock_get_parm_items = mocker.patch(
+            "houdini_package_runner.items.dialog_script._get_parm_items",
+            return_value=mock_items,
         )
 
         parm_value = 'parm {\n        name    "newparameter"\n        label   "Label"\n        type    float\n        default { [ "hou.pwd().path()[-1]" python ] }\n        range   { 0 10 }\n        parmtag { "script_callback" "" }\n        parmtag { "script_callback_language" "python" }\n    }'  # noqa: E501
@@ -166,6 +157,7 @@ class TestDialogScriptItem:
         mock_name = mocker.MagicMock(spec=str)
 
         inst = init_item()
+        inst._path = pathlib.Path("/some/source")
         inst._write_back = write_back
         inst._name = mock_name
         inst._ds_contents = contents
@@ -173,13 +165,12 @@ class TestDialogScriptItem:
         result = inst._gather_items()
 
         if test_file:
-            assert result == tuple(mock_callbacks + mock_expressions + mock_menus)
+            assert result == tuple(mock_items)
 
-            mock_get_callbacks.assert_called_with(parm_value, 4, mock_name)
-            mock_get_expressions.assert_called_with(parm_value, 4, mock_name)
-            mock_get_menus.assert_called_with(parm_value, 4, mock_name)
+            mock_get_parm_items.assert_called_with(parm_value, 4, mock_name)
 
             for item in result:
+                assert item.temp_dir_token == str(inst.path)
                 assert item.write_back == write_back
 
         else:
@@ -358,6 +349,7 @@ class TestDialogScriptInternalItem:
         assert inst._parm == mock_parm
         assert inst._start_offset == mock_start_offset
         assert inst._name == "first"
+        assert inst._temp_dir_token is None
         assert inst._display_hint == ""
         assert inst._display_name == mock_display_name + "_" + "first"
         assert inst._post_processed_code == mock_code
@@ -425,19 +417,26 @@ class TestDialogScriptInternalItem:
         """Test DialogScriptInternalItem._write_contents."""
         mock_temp_path = mocker.MagicMock(spec=pathlib.Path)
 
-        mock_handle = mocker.mock_open()
-
-        mock_temp_path.open = mock_handle
-
         inst = init_internal_item()
         inst._code = code
 
         inst._write_contents(mock_temp_path)
 
-        mock_handle.return_value.write.assert_called_with(expected_code)
+        mock_temp_path.write_text.assert_called_with(expected_code)
 
     # Properties
 
+    def test_temp_dir_token(self, mocker, init_internal_item):
+        """Test DialogScriptInternalItem.temp_dir_token."""
+        inst = init_internal_item()
+        inst._temp_dir_token = None
+
+        assert inst.temp_dir_token is None
+
+        inst.temp_dir_token = "/some/token"
+
+        assert inst._temp_dir_token == "/some/token"
+
     def test_code(self, mocker, init_internal_item):
         """Test DialogScriptInternalItem.code."""
         mock_code = mocker.MagicMock(spec=str)
@@ -531,20 +530,30 @@ class TestDialogScriptInternalItem:
     # Methods
 
     @pytest.mark.parametrize(
-        "write_back, contents_changed",
+        "write_back, contents_changed, has_token",
         (
-            (False, False),
-            (True, False),
-            (True, True),
+            (False, False, False),
+            (True, False, False),
+            (True, True, True),
         ),
     )
-    def test_process(self, mocker, init_internal_item, write_back, contents_changed):
+    def test_process(
+        self, mocker, init_internal_item, write_back, contents_changed, has_token
+    ):
         """Test DialogScriptInternalItem.process."""
         mock_temp_path = mocker.MagicMock(spec=pathlib.Path)
 
         mock_temp_dir = mocker.MagicMock(spec=pathlib.Path)
         mock_temp_dir.__truediv__.return_value = mock_temp_path
 
+        mock_item_dir = mocker.MagicMock(spec=pathlib.Path)
+        mock_item_dir.__truediv__.return_value = mock_temp_path
+
+        mock_get_item_dir = mocker.patch(
+            "houdini_package_runner.utils.get_item_temp_dir",
+            return_value=mock_item_dir,
+        )
+
         mock_runner = mocker.MagicMock(
             spec=houdini_package_runner.runners.base.HoudiniPackageRunner
         )
@@ -574,6 +583,7 @@ class TestDialogScriptInternalItem:
         inst._contents_changed = False
         inst._code = mock_code
         inst._post_processed_code = mock_code
+        inst._temp_dir_token = "/some/source" if has_token else None
         inst._write_back = write_back
         inst._display_name = "display_name"
         inst._display_hint = ""
@@ -582,7 +592,14 @@ class TestDialogScriptInternalItem:
 
         assert result == mock_runner.process_path.return_value
 
-        mock_temp_dir.__truediv__.assert_called_with("display_name.py")
+        # Items with a token write under their own subdirectory.
+        if has_token:
+            mock_get_item_dir.assert_called_with(mock_temp_dir, "/some/source")
+            mock_item_dir.__truediv__.assert_called_with("display_name.py")
+
+        else:
+            mock_get_item_dir.assert_not_called()
+            mock_temp_dir.__truediv__.assert_called_with("display_name.py")
 
         mock_write.assert_called_with(mock_temp_path)
 
@@ -823,13 +840,20 @@ class TestDialogScriptMenuScriptItem:
         assert ignored == ["kwargs"]
 
     @pytest.mark.parametrize(
-        "use_tabs, expected",
+        "contents, use_tabs, expected",
         (
-            (True, '[ "foo" ]\n\t\t\t\t[ "bar" ]\n\t\t\t\t[ "baz" ]\n'),
-            (False, '[ "foo" ]\n    [ "bar" ]\n    [ "baz" ]\n'),
+            (
+                "foo\nbar\nbaz",
+                True,
+                '[ "foo" ]\n\t\t\t\t[ "bar" ]\n\t\t\t\t[ "baz" ]\n',
+            ),
+            ("foo\nbar\nbaz", False, '[ "foo" ]\n    [ "bar" ]\n    [ "baz" ]\n'),
+            ("", False, ""),
         ),
     )
-    def test__post_process_contents(self, mocker, init_menu_item, use_tabs, expected):
+    def test__post_process_contents(
+        self, mocker, init_menu_item, contents, use_tabs, expected
+    ):
         """Test DialogScriptMenuScriptItem._post_process_contents."""
         mock_data = mocker.MagicMock(
             spec=houdini_package_runner.items.dialog_script.PythonMenuScriptResult
@@ -837,8 +861,6 @@ class TestDialogScriptMenuScriptItem:
         mock_data.uses_tabs = use_tabs
         mock_data.indent = 4
 
-        contents = "foo\nbar\nbaz"
-
         inst = init_menu_item()
         inst._menu_script_data = mock_data
 
@@ -890,21 +912,6 @@ def test__escape_contents_for_single_line():
     assert result == 'foo\\rbar\\n\\"thing\\"'
 
 
-@pytest.mark.parametrize(
-    "value, expected",
-    (
-        ('parmtag { "script_callback_language" "python" }', "python"),
-        ('parmtag { "script_callback_language" "hscript" }', "hscript"),
-        ("parmtag { }", None),
-    ),
-)
-def test__get_callback_language(value, expected):
-    """Test houdini_package_runner.items.dialog_script._get_callback_language."""
-    result = houdini_package_runner.items.dialog_script._get_callback_language(value)
-
-    assert result == expected
-
-
 @pytest.mark.parametrize(
     "parm_start, span, inclusive, expected",
     (
@@ -924,209 +931,113 @@ def test__get_ds_file_offset(parm_start, span, inclusive, expected):
 
 
 @pytest.mark.parametrize(
-    "is_python, has_callback",
+    "test_file, expected_kind",
     (
-        (True, True),
-        (True, False),
-        (False, False),
+        ("test__get_script_callback.ds", "callback"),
+        ("test__get_default_python_expressions.ds", "expression"),
+        ("test__get_python_menu_script/tabs.ds", "menu"),
+        (None, None),
     ),
 )
-def test__get_callback_items(mocker, is_python, has_callback):
-    """Test houdini_package_runner.items.dialog_script._get_callback_items."""
-    mock_parm = mocker.MagicMock(spec=str)
-    mock_parm_start = mocker.MagicMock(spec=int)
-    mock_name = mocker.MagicMock(spec=str)
-
-    mock_script = mocker.MagicMock(spec=str)
-    mock_span = mocker.MagicMock(spec=tuple)
-
-    language = "python" if is_python else "hscript"
-    mock_get_lang = mocker.patch(
-        "houdini_package_runner.items.dialog_script._get_callback_language",
-        return_value=language,
-    )
-
-    script = (mock_script, mock_span) if has_callback else None
-
-    mock_get_script = mocker.patch(
-        "houdini_package_runner.items.dialog_script._get_script_callback",
-        return_value=script,
-    )
-
-    mock_callback_item = mocker.patch(
-        "houdini_package_runner.items.dialog_script.DialogScriptCallbackItem"
-    )
-
-    result = houdini_package_runner.items.dialog_script._get_callback_items(
-        mock_parm, mock_parm_start, mock_name
-    )
-
-    if is_python:
-        mock_get_script.assert_called_with(mock_parm)
-
-    if is_python and has_callback:
-        assert result == [mock_callback_item.return_value]
-
-        mock_callback_item.assert_called_with(
-            mock_parm, mock_script, mock_parm_start, mock_span, mock_name
-        )
+def test__get_parm_items(mocker, shared_datadir, test_file, expected_kind):
+    """Test houdini_package_runner.items.dialog_script._get_parm_items."""
+    if test_file is not None:
+        with (shared_datadir / test_file).open() as handle:
+            contents = handle.read()
 
     else:
-        assert not result
-
-        mock_callback_item.assert_not_called()
-
-    mock_get_lang.assert_called_with(mock_parm)
-
-
-def test__get_default_python_expressions(shared_datadir):
-    """Test houdini_package_runner.items.dialog_script._get_default_python_expressions."""
-    test_path = shared_datadir / "test__get_default_python_expressions.ds"
-
-    with test_path.open() as handle:
-        contents = handle.read()
-
-    result = houdini_package_runner.items.dialog_script._get_default_python_expressions(
-        contents
-    )
-
-    assert result == (('hou.hscript("$FF")', (123, 145)),)
-
+        contents = ""
 
-def test__get_expression_items(mocker):
-    """Test houdini_package_runner.items.dialog_script._get_expression_items."""
-    mock_parm = mocker.MagicMock(spec=str)
     mock_parm_start = mocker.MagicMock(spec=int)
     mock_name = mocker.MagicMock(spec=str)
 
-    mock_expr1 = mocker.MagicMock(spec=str)
-    mock_span1 = mocker.MagicMock(spec=tuple)
-
-    mock_expr2 = mocker.MagicMock(spec=str)
-    mock_span2 = mocker.MagicMock(spec=tuple)
-
-    mock_default_expressions = [(mock_expr1, mock_span1), (mock_expr2, mock_span2)]
-    mock_get_exprs = mocker.patch(
-        "houdini_package_runner.items.dialog_script._get_default_python_expressions",
-        return_value=mock_default_expressions,
+    mock_callback_item = mocker.patch(
+        "houdini_package_runner.items.dialog_script.DialogScriptCallbackItem"
     )
-
     mock_expr_item = mocker.patch(
         "houdini_package_runner.items.dialog_script.DialogScriptDefaultExpressionItem"
     )
-
-    result = houdini_package_runner.items.dialog_script._get_expression_items(
-        mock_parm, mock_parm_start, mock_name
+    mock_menu_item = mocker.patch(
+        "houdini_package_runner.items.dialog_script.DialogScriptMenuScriptItem"
     )
 
-    assert result == [mock_expr_item.return_value, mock_expr_item.return_value]
-
-    mock_get_exprs.assert_called_with(mock_parm)
-
-    mock_expr_item.assert_has_calls(
-        [
-            mocker.call(
-                mock_parm, mock_expr1, mock_parm_start, mock_span1, mock_name, 0
-            ),
-            mocker.call(
-                mock_parm, mock_expr2, mock_parm_start, mock_span2, mock_name, 1
-            ),
-        ]
+    result = houdini_package_runner.items.dialog_script._get_parm_items(
+        contents, mock_parm_start, mock_name
     )
 
+    if expected_kind == "callback":
+        assert result == [mock_callback_item.return_value]
 
-@pytest.mark.parametrize("script_exists", (True, False))
-def test__get_menu_items(mocker, script_exists):
-    """Test houdini_package_runner.items.dialog_script._get_menu_items."""
-    mock_parm = mocker.MagicMock(spec=str)
-    mock_parm_start = mocker.MagicMock(spec=int)
-    mock_name = mocker.MagicMock(spec=str)
-
-    mock_item = (
-        mocker.MagicMock(
-            spec=houdini_package_runner.items.dialog_script.PythonMenuScriptResult
+        mock_callback_item.assert_called_with(
+            contents,
+            "hou.hm().callback(hou.pwd())",
+            mock_parm_start,
+            (165, 195),
+            mock_name,
         )
-        if script_exists
-        else None
-    )
-
-    mock_get_script = mocker.patch(
-        "houdini_package_runner.items.dialog_script._get_python_menu_script",
-        return_value=mock_item,
-    )
 
-    mock_ds_item = mocker.patch(
-        "houdini_package_runner.items.dialog_script.DialogScriptMenuScriptItem"
-    )
+    elif expected_kind == "expression":
+        assert result == [mock_expr_item.return_value]
 
-    result = houdini_package_runner.items.dialog_script._get_menu_items(
-        mock_parm, mock_parm_start, mock_name
-    )
-
-    if script_exists:
-        assert result == [mock_ds_item.return_value]
-        mock_ds_item.assert_called_with(
-            mock_parm, mock_parm_start, mock_name, mock_item
+        mock_expr_item.assert_called_with(
+            contents, 'hou.hscript("$FF")', mock_parm_start, (123, 145), mock_name, 0
         )
 
-    else:
-        assert not result
-
-    mock_get_script.assert_called_with(mock_parm)
+    elif expected_kind == "menu":
+        assert result == [mock_menu_item.return_value]
 
+        expected_data = (
+            houdini_package_runner.items.dialog_script.PythonMenuScriptResult(
+                "import os\n\nreturn [1,2,3,4]", (84, 134), 2, True
+            )
+        )
 
-@pytest.mark.parametrize(
-    "test_file, expected",
-    (
-        ("tabs.ds", ((84, 134), 2, True)),
-        ("spaces.ds", ((129, 199), 12, False)),
-        (None, ()),
-    ),
-)
-def test__get_python_menu_script(shared_datadir, test_file, expected):
-    """Test houdini_package_runner.items.dialog_script._get_python_menu_script."""
-    expected_script = """import os
-
-return [1,2,3,4]"""
-
-    if test_file is not None:
-        test_path = shared_datadir / "test__get_python_menu_script" / test_file
+        mock_menu_item.assert_called_with(
+            contents, mock_parm_start, mock_name, expected_data
+        )
 
-        with test_path.open() as handle:
-            contents = handle.read()
     else:
-        contents = ""
+        assert result == []
+
 
-    result = houdini_package_runner.items.dialog_script._get_python_menu_script(
-        contents
+def test__scan_parm_constructs_first_entries_win():
+    """Test that duplicated constructs keep their first occurrence."""
+    parm = (
+        'parmtag { "script_callback_language" "python" }\n'
+        'parmtag { "script_callback_language" "hscript" }\n'
+        'parmtag { "script_callback" "first()" }\n'
+        'parmtag { "script_callback" "second()" }\n'
     )
 
-    if test_file is not None:
-        assert result.menu_script == expected_script
-        assert result.span == expected[0]
-        assert result.indent == expected[1]
-        assert result.uses_tabs == expected[2]
+    result = houdini_package_runner.items.dialog_script._scan_parm_constructs(parm)
 
-    else:
-        assert result is None
+    callback_language, callback_data, python_expressions, menu_match = result
 
+    assert callback_language == "python"
+    assert callback_data[0] == "first()"
+    assert python_expressions == []
+    assert menu_match is None
 
-@pytest.mark.parametrize("has_match", (True, False))
-def test__get_script_callback(shared_datadir, has_match):
-    """Test houdini_package_runner.items.dialog_script._get_script_callback."""
 
-    if has_match:
-        test_path = shared_datadir / "test__get_script_callback.ds"
+def test__scan_parm_definitions():
+    """Test houdini_package_runner.items.dialog_script._scan_parm_definitions."""
+    contents = (
+        "parm {\n"
+        '    name "valid"\n'
+        '    parmtag { "script_callback" "parm { nested }" }\n'
+        "}\n"
+        "parm { unclosed"
+    )
 
-        with test_path.open() as handle:
-            contents = handle.read()
-    else:
-        contents = ""
+    results = list(
+        houdini_package_runner.items.dialog_script._scan_parm_definitions(contents)
+    )
 
-    result = houdini_package_runner.items.dialog_script._get_script_callback(contents)
+    # The nested mention inside the string and the unparseable trailing
+    # candidate should both be skipped.
+    assert len(results) == 1
 
-    if has_match:
-        assert result == ("hou.hm().callback(hou.pwd())", (165, 195))
+    match, start = results[0]
 
-    else:
-        assert result is None
+    assert start == 0
+    assert match[0].startswith("parm {")
@@ -5,6 +5,8 @@
 # =============================================================================
 
 # Standard Library
+import json
+import os
 import pathlib
 
 # Third Party
@@ -158,16 +160,16 @@ class TestExpandedOperatorType:
             side_effect=[mock_file1, mock_file2],
         )
 
-        mock_source_file = mocker.MagicMock(spec=pathlib.Path)
+        source_file = "/some/source.otl?some::operator"
 
-        mock_path = mocker.MagicMock(spec=pathlib.Path)
+        path = pathlib.Path("/some/path/operator_dir")
 
         mock_write_back = mocker.MagicMock(spec=bool)
 
         mocker.patch.object(
             houdini_package_runner.items.digital_asset.ExpandedOperatorType,
             "path",
-            mock_path,
+            path,
         )
         mocker.patch.object(
             houdini_package_runner.items.digital_asset.ExpandedOperatorType,
@@ -175,21 +177,18 @@ class TestExpandedOperatorType:
             mock_write_back,
         )
 
-        mock_section1 = mocker.MagicMock(spec=pathlib.Path)
-        mock_section2 = mocker.MagicMock(spec=pathlib.Path)
+        section1 = path / "PythonModule"
+        section2 = path / "PythonCook"
 
-        sections = [mock_section1, mock_section2]
+        sections = [section1, section2]
 
         inst = init_expanded()
-        inst._source_file = mock_source_file if has_sourcefile else None
+        inst._source_file = source_file if has_sourcefile else None
 
-        if has_sourcefile:
-            expected_display_name1 = mock_source_file / mock_section1.name
-            expected_display_name2 = mock_source_file / mock_section2.name
+        base_path = source_file if has_sourcefile else str(path)
 
-        else:
-            expected_display_name1 = mock_path / mock_section1.name
-            expected_display_name2 = mock_path / mock_section2.name
+        expected_display_name1 = os.path.join(base_path, "PythonModule")
+        expected_display_name2 = os.path.join(base_path, "PythonCook")
 
         result = inst._build_python_section_items(sections)
 
@@ -198,13 +197,13 @@ class TestExpandedOperatorType:
         mock_init_file.assert_has_calls(
             [
                 mocker.call(
-                    mock_section1,
-                    str(expected_display_name1),
+                    section1,
+                    expected_display_name1,
                     write_back=mock_write_back,
                 ),
                 mocker.call(
-                    mock_section2,
-                    str(expected_display_name2),
+                    section2,
+                    expected_display_name2,
                     write_back=mock_write_back,
                 ),
             ]
@@ -223,7 +222,6 @@ class TestExpandedOperatorType:
         )
 
         mock_path = mocker.MagicMock(spec=pathlib.Path)
-        mock_path.__truediv__.return_value.exists.return_value = cook_exists
 
         mocker.patch.object(
             houdini_package_runner.items.digital_asset.ExpandedOperatorType,
@@ -231,6 +229,16 @@ class TestExpandedOperatorType:
             mock_path,
         )
 
+        mocker.patch.object(
+            houdini_package_runner.items.digital_asset.ExpandedOperatorType,
+            "_scan_children",
+            return_value=(
+                {"PythonCook": mocker.MagicMock(spec=os.DirEntry)}
+                if cook_exists
+                else {}
+            ),
+        )
+
         expected = [mock_section1, mock_section2]
 
         if cook_exists:
@@ -242,7 +250,8 @@ class TestExpandedOperatorType:
 
         assert result == expected
 
-        mock_path.__truediv__.assert_called_with("PythonCook")
+        if cook_exists:
+            mock_path.__truediv__.assert_called_with("PythonCook")
 
     @pytest.mark.parametrize(
         "shelf_exists, has_sourcefile",
@@ -257,7 +266,16 @@ class TestExpandedOperatorType:
     ):
         """Test ExpandedOperatorType._find_internal_shelf_item."""
         mock_path = mocker.MagicMock(spec=pathlib.Path)
-        mock_path.__truediv__.return_value.exists.return_value = shelf_exists
+
+        mocker.patch.object(
+            houdini_package_runner.items.digital_asset.ExpandedOperatorType,
+            "_scan_children",
+            return_value=(
+                {"Tools.shelf": mocker.MagicMock(spec=os.DirEntry)}
+                if shelf_exists
+                else {}
+            ),
+        )
 
         mock_name = mocker.MagicMock(spec=str)
         mock_write_back = mocker.MagicMock(spec=bool)
@@ -278,10 +296,10 @@ class TestExpandedOperatorType:
             mock_name,
         )
 
-        mock_source_file = mocker.MagicMock(spec=pathlib.Path)
+        source_file = "/some/source.otl?some::operator"
 
         expected_display = (
-            str(mock_source_file / "Tools.shelf") if has_sourcefile else None
+            os.path.join(source_file, "Tools.shelf") if has_sourcefile else None
         )
 
         mock_init_shelf = mocker.patch(
@@ -289,7 +307,7 @@ class TestExpandedOperatorType:
         )
 
         inst = init_expanded()
-        inst._source_file = mock_source_file if has_sourcefile else None
+        inst._source_file = source_file if has_sourcefile else None
 
         result = inst._find_internal_shelf_item()
 
@@ -420,11 +438,32 @@ class TestExpandedOperatorType:
             write_back=mock_write_back,
         )
 
-    @pytest.mark.parametrize("options_exist", (True, False))
+    @pytest.mark.parametrize(
+        "options_exist, use_orjson",
+        (
+            (True, True),
+            (True, False),
+            (False, True),
+            (False, False),
+        ),
+    )
     def test__get_extra_python_section_files(
-        self, mocker, shared_datadir, init_expanded, options_exist
+        self, mocker, shared_datadir, init_expanded, options_exist, use_orjson
     ):
         """Test ExpandedOperatorType._get_extra_python_section_files."""
+        if use_orjson:
+            mock_orjson = mocker.MagicMock()
+            mock_orjson.loads = json.loads
+
+            mocker.patch.object(
+                houdini_package_runner.items.digital_asset, "orjson", mock_orjson
+            )
+
+        else:
+            mocker.patch.object(
+                houdini_package_runner.items.digital_asset, "orjson", None
+            )
+
         if options_exist:
             path = shared_datadir / "test__get_extra_python_section_files"
 
@@ -446,6 +485,26 @@ class TestExpandedOperatorType:
         else:
             assert result == []
 
+    def test__scan_children(self, mocker, tmp_path, init_expanded):
+        """Test ExpandedOperatorType._scan_children."""
+        (tmp_path / "PythonCook").touch()
+
+        mocker.patch.object(
+            houdini_package_runner.items.digital_asset.ExpandedOperatorType,
+            "path",
+            tmp_path,
+        )
+
+        inst = init_expanded()
+        inst._child_entries = None
+
+        result = inst._scan_children()
+
+        assert list(result) == ["PythonCook"]
+
+        # The scan result should be cached on the instance.
+        assert inst._scan_children() is result
+
     # Properties
 
     def test_name(self, mocker, init_expanded):
@@ -590,8 +649,8 @@ class TestDigitalAssetDirectory:
 
         if has_source_file:
             expected_display_names = [
-                pathlib.PurePath(f"{mock_source_file}?{mock_op_name1}"),
-                pathlib.PurePath(f"{mock_source_file}?{mock_op_name2}"),
+                f"{mock_source_file}?{mock_op_name1}",
+                f"{mock_source_file}?{mock_op_name2}",
             ]
         else:
             expected_display_names = [None, None]
@@ -644,10 +703,10 @@ class TestDigitalAssetDirectory:
             result = inst._find_operator_dirs()
 
             assert result == [
-                [
+                (
                     "com.houdinitoolbox_8_8Sop_1cppwrangle_8_81",
                     "com.houdinitoolbox::Sop/cppwrangle::1",
-                ]
+                )
             ]
 
     # Methods
@@ -804,14 +863,24 @@ class TestBinaryDigitalAssetFile:
             write_back,
         )
 
-        target_folder = mock_runner.temp_dir.__truediv__.return_value
+        mock_item_dir = mocker.MagicMock(spec=pathlib.Path)
+
+        mock_get_item_dir = mocker.patch(
+            "houdini_package_runner.utils.get_item_temp_dir",
+            return_value=mock_item_dir,
+        )
+
+        target_folder = mock_item_dir.__truediv__.return_value
 
         inst = init_binary()
         result = inst.process(mock_runner)
 
         assert result == mock_init_dir.return_value.process.return_value
 
-        mock_runner.temp_dir.__truediv__.assert_called_with(mock_path.name)
+        # The extraction target goes under the asset's own temp subdirectory.
+        mock_get_item_dir.assert_called_with(mock_runner.temp_dir, str(mock_path))
+
+        mock_item_dir.__truediv__.assert_called_with(mock_path.name)
 
         mock_extract.assert_called_with(mock_runner.hotl_command, target_folder)
 
@@ -828,15 +897,13 @@ class TestBinaryDigitalAssetFile:
 
 
 @pytest.mark.parametrize("exists", (True, False))
-def test_is_expanded_digital_asset_dir(mocker, exists):
+def test_is_expanded_digital_asset_dir(tmp_path, exists):
     """Test houdini_package_runner.items.digital_asset.is_expanded_digital_asset_dir."""
-    mock_path = mocker.MagicMock(spec=pathlib.Path)
-    mock_path.__truediv__.return_value.is_file.return_value = exists
+    if exists:
+        (tmp_path / "Sections.list").touch()
 
     result = houdini_package_runner.items.digital_asset.is_expanded_digital_asset_dir(
-        mock_path
+        tmp_path
     )
 
     assert result == exists
-
-    mock_path.__truediv__.assert_called_with("Sections.list")
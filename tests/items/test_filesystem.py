@@ -249,8 +249,15 @@ class TestFileToProcess:
 
     # Methods
 
-    @pytest.mark.parametrize("contents_changed", (True, False))
-    def test_process(self, mocker, init_file_item, contents_changed):
+    @pytest.mark.parametrize(
+        "write_back, contents_changed",
+        (
+            (True, True),
+            (True, False),
+            (False, False),
+        ),
+    )
+    def test_process(self, mocker, init_file_item, write_back, contents_changed):
         """Test FileToProcess.process."""
         mock_runner = mocker.MagicMock(
             spec=houdini_package_runner.runners.base.HoudiniPackageRunner
@@ -271,6 +278,9 @@ class TestFileToProcess:
         mock_path = mocker.MagicMock(spec=pathlib.Path)
 
         inst = init_file_item()
+        inst._contents_changed = False
+        inst._write_back = write_back
+
         mocker.patch.object(
             houdini_package_runner.items.filesystem.FileToProcess,
             "path",
@@ -284,12 +294,18 @@ class TestFileToProcess:
         assert inst.contents_changed == contents_changed
 
         mock_runner.process_path.assert_called_with(mock_path, inst)
-        mock_compute.assert_has_calls(
-            [
-                mocker.call(mock_path),
-                mocker.call(mock_path),
-            ]
-        )
+
+        if write_back:
+            mock_compute.assert_has_calls(
+                [
+                    mocker.call(mock_path),
+                    mocker.call(mock_path),
+                ]
+            )
+
+        # Read-only runs shouldn't pay for any hashing.
+        else:
+            mock_compute.assert_not_called()
 
 
 class TestHoudiniScriptsDirectoryItem:
@@ -344,8 +360,8 @@ class TestPythonPackageDirectoryItem:
 @pytest.mark.parametrize(
     "file_name, expected",
     [
-        ("python_file.py", "d41d8cd98f00b204e9800998ecf8427e"),
-        ("decode_error.hip", "7db20f4b9bff4b5b07d067ed70521b71"),
+        ("python_file.py", "cae66941d9efbd404e4d88758ea67670"),
+        ("decode_error.hip", "9050f9998f86e6cea112a36c3d000ab8"),
     ],
 )
 def test_compute_file_hash(shared_datadir, file_name, expected):
@@ -125,7 +125,9 @@ class TestXMLBase:
     def test__handle_write_back(self, mocker, init_base, has_cdata, contents_changed):
         """Test XMLBase._handle_write_back."""
         tostring_result = (
-            "something CDATA something" if has_cdata else "something something"
+            b"something <![CDATA[code]]> something"
+            if has_cdata
+            else b"something something"
         )
 
         mock_tostring = mocker.patch(
@@ -137,45 +139,42 @@ class TestXMLBase:
         mock_text = mocker.MagicMock(spec=str)
         mock_changed_text = mocker.MagicMock(spec=str)
 
-        mock_cdata.return_value = mock_changed_text if contents_changed else mock_text
+        mock_cdata.return_value = mock_changed_text
 
         mock_section = mocker.MagicMock()
         mock_section.text = mock_text
 
         mock_temp_path = mocker.MagicMock(spec=pathlib.Path)
-
-        mock_handle = mocker.mock_open()
-        mock_handle.return_value.read.return_value = (
+        mock_temp_path.read_text.return_value = (
             mock_changed_text if contents_changed else mock_text
         )
-        mock_temp_path.open = mock_handle
 
         inst = init_base()
         inst._contents_changed = False
 
         inst._handle_write_back(mock_section, mock_temp_path)
 
-        mock_tostring.assert_called_with(mock_section, encoding="unicode")
-
         if contents_changed:
             assert inst.contents_changed
 
+            mock_tostring.assert_called_with(mock_section, with_tail=False)
+
             if has_cdata:
                 assert mock_section.text == etree.CDATA(mock_changed_text)
 
             else:
                 assert mock_section.text == mock_changed_text
 
+        # Unchanged contents should leave the section untouched.
         else:
-            if has_cdata:
-                assert mock_section.text == etree.CDATA(mock_text)
+            assert not inst.contents_changed
 
-            else:
-                assert mock_section.text == mock_text
+            mock_tostring.assert_not_called()
 
-    @pytest.mark.parametrize("write_back", (True, False))
-    def test__process_code_section(self, mocker, init_base, write_back):
-        """Test XMLBase._process_code_section."""
+            assert mock_section.text == mock_text
+
+    def test__write_code_section(self, mocker, init_base):
+        """Test XMLBase._write_code_section."""
         mock_text = mocker.MagicMock(spec=str)
 
         mock_section = mocker.MagicMock()
@@ -183,39 +182,35 @@ class TestXMLBase:
 
         mock_base_name = mocker.MagicMock(spec=str)
 
-        mock_handle = mocker.mock_open()
-
         mock_temp_path = mocker.MagicMock(spec=pathlib.Path)
-        mock_temp_path.open = mock_handle
+
+        mock_item_dir = mocker.MagicMock(spec=pathlib.Path)
+        mock_item_dir.__truediv__.return_value = mock_temp_path
+
+        mock_get_item_dir = mocker.patch(
+            "houdini_package_runner.utils.get_item_temp_dir",
+            return_value=mock_item_dir,
+        )
 
         mock_runner = mocker.MagicMock(
             spec=houdini_package_runner.runners.base.HoudiniPackageRunner
         )
-        mock_runner.temp_dir.__truediv__.return_value = mock_temp_path
 
-        mock_handle_write_back = mocker.patch.object(
-            houdini_package_runner.items.xml.XMLBase, "_handle_write_back"
-        )
+        mock_path = mocker.MagicMock(spec=pathlib.Path)
 
         inst = init_base()
-        inst.write_back = write_back
-
-        result = inst._process_code_section(mock_section, mock_runner, mock_base_name)
-
-        assert result == mock_runner.process_path.return_value
+        inst._path = mock_path
 
-        mock_runner.temp_dir.__truediv__.assert_called_with(f"{mock_base_name}.py")
+        result = inst._write_code_section(mock_section, mock_runner, mock_base_name)
 
-        mock_temp_path.open.assert_called_with("w")
-        mock_handle.return_value.write.assert_called_with(str(mock_text))
+        assert result == mock_temp_path
 
-        mock_runner.process_path.assert_called_with(mock_temp_path, inst)
+        # The section file goes under the item's own temp subdirectory.
+        mock_get_item_dir.assert_called_with(mock_runner.temp_dir, str(mock_path))
 
-        if write_back:
-            mock_handle_write_back.assert_called_with(mock_section, mock_temp_path)
+        mock_item_dir.__truediv__.assert_called_with(f"{mock_base_name}.py")
 
-        else:
-            mock_handle_write_back.assert_not_called()
+        mock_temp_path.write_text.assert_called_with(str(mock_text))
 
     @pytest.mark.parametrize(
         "write_back, contents_changed, return_codes, expected",
@@ -230,26 +225,46 @@ class TestXMLBase:
         self, mocker, init_base, write_back, contents_changed, return_codes, expected
     ):
         """Test XMLBase.process."""
-        mock_process = mocker.patch.object(
-            houdini_package_runner.items.xml.XMLBase,
-            "_process_code_section",
-            side_effect=return_codes,
+        mock_handle_write_back = mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase, "_handle_write_back"
         )
 
         mock_section1 = mocker.MagicMock()
+        mock_section1.text = "code1"
         mock_name1 = mocker.MagicMock()
 
         mock_section2 = mocker.MagicMock()
+        mock_section2.text = "code2"
         mock_name2 = mocker.MagicMock()
 
-        mock_get_items = mocker.patch.object(
-            houdini_package_runner.items.xml.XMLBase, "_get_items_to_process"
-        )
-        mock_get_items.return_value = (
+        items = (
             (mock_section1, mock_name1),
             (mock_section2, mock_name2),
         )
 
+        mock_get_items = mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase,
+            "_get_items_to_process",
+            return_value=items,
+        )
+
+        mock_element = mocker.MagicMock()
+
+        mock_get_element_items = mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase,
+            "_get_items_from_element",
+            return_value=items,
+        )
+
+        mock_temp_path1 = mocker.MagicMock(spec=pathlib.Path)
+        mock_temp_path2 = mocker.MagicMock(spec=pathlib.Path)
+
+        mock_write_section = mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase,
+            "_write_code_section",
+            side_effect=(mock_temp_path1, mock_temp_path2),
+        )
+
         mock_root = mocker.MagicMock()
 
         mock_tree = mocker.MagicMock()
@@ -259,10 +274,18 @@ class TestXMLBase:
         mock_parse = mocker.patch(
             "houdini_package_runner.items.xml.etree.parse", return_value=mock_tree
         )
+        mock_open = mocker.patch("builtins.open", mocker.mock_open())
+        mock_iterparse = mocker.patch(
+            "houdini_package_runner.items.xml.etree.iterparse",
+            return_value=iter((("end", mock_element),)),
+        )
 
         mock_runner = mocker.MagicMock(
             spec=houdini_package_runner.runners.base.HoudiniPackageRunner
         )
+        mock_runner.parallel = False
+        mock_runner.process_path.side_effect = return_codes
+        mock_runner.process_paths.return_value = expected
 
         mock_path = mocker.MagicMock(spec=pathlib.Path)
 
@@ -275,25 +298,234 @@ class TestXMLBase:
 
         assert result == expected
 
-        mock_parser.assert_called_with(strip_cdata=False)
-        mock_parse.assert_called_with(str(inst.path), mock_parser.return_value)
-        mock_get_items.assert_called_with(mock_root)
+        if write_back:
+            mock_parser.assert_called_with(
+                strip_cdata=False,
+                collect_ids=False,
+                resolve_entities=False,
+                huge_tree=True,
+            )
+            mock_parse.assert_called_with(str(inst.path), mock_parser.return_value)
+            mock_get_items.assert_called_with(mock_root)
 
-        mock_process.assert_has_calls(
-            (
-                mocker.call(mock_section1, mock_runner, mock_name1),
-                mocker.call(mock_section2, mock_runner, mock_name2),
+            mock_iterparse.assert_not_called()
+
+            mock_write_section.assert_has_calls(
+                (
+                    mocker.call(mock_section1, mock_runner, mock_name1),
+                    mocker.call(mock_section2, mock_runner, mock_name2),
+                )
             )
-        )
+
+            mock_runner.process_path.assert_has_calls(
+                (
+                    mocker.call(mock_temp_path1, inst),
+                    mocker.call(mock_temp_path2, inst),
+                )
+            )
+
+            mock_handle_write_back.assert_has_calls(
+                (
+                    mocker.call(mock_section1, mock_temp_path1),
+                    mocker.call(mock_section2, mock_temp_path2),
+                )
+            )
+
+        else:
+            mock_iterparse.assert_called_with(
+                str(inst.path),
+                events=("end",),
+                tag=houdini_package_runner.items.xml.XMLBase._ITEM_TAG,
+                strip_cdata=False,
+                collect_ids=False,
+                resolve_entities=False,
+                huge_tree=True,
+            )
+            mock_get_element_items.assert_called_with(mock_element)
+            mock_element.clear.assert_called_with(keep_tail=True)
+
+            mock_write_section.assert_has_calls(
+                (
+                    mocker.call(mock_section1, mock_runner, mock_name1),
+                    mocker.call(mock_section2, mock_runner, mock_name2),
+                )
+            )
+
+            mock_runner.process_paths.assert_called_with(
+                [mock_temp_path1, mock_temp_path2], inst
+            )
+
+            mock_parse.assert_not_called()
 
         if write_back and contents_changed:
+            mock_open.assert_called_with(str(inst.path), "wb", buffering=1 << 20)
             mock_tree.write.assert_called_with(
-                str(inst.path), encoding="utf-8", xml_declaration=True
+                mock_open.return_value, encoding="utf-8", xml_declaration=True
             )
 
         else:
             mock_tree.write.assert_not_called()
 
+    def test_process_read_only_no_sections(self, mocker, init_base):
+        """Test XMLBase.process read-only with no matched sections."""
+        mocker.patch(
+            "houdini_package_runner.items.xml.etree.iterparse",
+            return_value=iter(()),
+        )
+
+        mock_runner = mocker.MagicMock(
+            spec=houdini_package_runner.runners.base.HoudiniPackageRunner
+        )
+
+        inst = init_base()
+        inst._path = mocker.MagicMock(spec=pathlib.Path)
+        inst.write_back = False
+
+        result = inst.process(mock_runner)
+
+        assert result == 0
+
+        # No batch should be dispatched when nothing was found.
+        mock_runner.process_paths.assert_not_called()
+
+    def test_process_deduplicates_identical_sections(self, mocker, init_base):
+        """Test XMLBase.process only checks identical section bodies once."""
+        mock_handle_write_back = mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase, "_handle_write_back"
+        )
+
+        mock_section1 = mocker.MagicMock()
+        mock_section1.text = "same code"
+        mock_name1 = mocker.MagicMock()
+
+        mock_section2 = mocker.MagicMock()
+        mock_section2.text = "same code"
+        mock_name2 = mocker.MagicMock()
+
+        mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase,
+            "_get_items_to_process",
+            return_value=((mock_section1, mock_name1), (mock_section2, mock_name2)),
+        )
+
+        mock_temp_path = mocker.MagicMock(spec=pathlib.Path)
+
+        mock_write_section = mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase,
+            "_write_code_section",
+            return_value=mock_temp_path,
+        )
+
+        mocker.patch("houdini_package_runner.items.xml.etree.XMLParser")
+        mocker.patch("houdini_package_runner.items.xml.etree.parse")
+
+        mock_runner = mocker.MagicMock(
+            spec=houdini_package_runner.runners.base.HoudiniPackageRunner
+        )
+        mock_runner.parallel = False
+        mock_runner.process_path.return_value = 0
+
+        inst = init_base()
+        inst._path = mocker.MagicMock(spec=pathlib.Path)
+        inst.write_back = True
+        inst.contents_changed = False
+
+        result = inst.process(mock_runner)
+
+        assert result == 0
+
+        # Only the first section should be written and checked.
+        mock_write_section.assert_called_once_with(
+            mock_section1, mock_runner, mock_name1
+        )
+        mock_runner.process_path.assert_called_once_with(mock_temp_path, inst)
+
+        # Both sections get the write back applied from the shared temp file.
+        mock_handle_write_back.assert_has_calls(
+            (
+                mocker.call(mock_section1, mock_temp_path),
+                mocker.call(mock_section2, mock_temp_path),
+            )
+        )
+
+    def test_process_parallel_write_back(self, mocker, init_base):
+        """Test XMLBase.process with parallel write back enabled."""
+        mock_section1 = mocker.MagicMock()
+        mock_name1 = mocker.MagicMock()
+
+        mock_section2 = mocker.MagicMock()
+        mock_name2 = mocker.MagicMock()
+
+        mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase,
+            "_get_items_to_process",
+            return_value=((mock_section1, mock_name1), (mock_section2, mock_name2)),
+        )
+
+        mock_temp_path1 = mocker.MagicMock(spec=pathlib.Path)
+        mock_temp_path2 = mocker.MagicMock(spec=pathlib.Path)
+
+        mock_write_section = mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase,
+            "_write_code_section",
+            side_effect=(mock_temp_path1, mock_temp_path2),
+        )
+
+        mock_handle_write_back = mocker.patch.object(
+            houdini_package_runner.items.xml.XMLBase, "_handle_write_back"
+        )
+
+        mock_tree = mocker.MagicMock()
+
+        mocker.patch("houdini_package_runner.items.xml.etree.XMLParser")
+        mocker.patch(
+            "houdini_package_runner.items.xml.etree.parse", return_value=mock_tree
+        )
+        mock_open = mocker.patch("builtins.open", mocker.mock_open())
+
+        mock_runner = mocker.MagicMock(
+            spec=houdini_package_runner.runners.base.HoudiniPackageRunner
+        )
+        mock_runner.parallel = True
+        mock_runner.process_path.side_effect = (0, 1)
+
+        mock_path = mocker.MagicMock(spec=pathlib.Path)
+
+        inst = init_base()
+        inst._path = mock_path
+        inst.write_back = True
+        inst.contents_changed = True
+
+        result = inst.process(mock_runner)
+
+        assert result == 1
+
+        mock_write_section.assert_has_calls(
+            (
+                mocker.call(mock_section1, mock_runner, mock_name1),
+                mocker.call(mock_section2, mock_runner, mock_name2),
+            )
+        )
+
+        mock_runner.process_path.assert_has_calls(
+            (
+                mocker.call(mock_temp_path1, inst),
+                mocker.call(mock_temp_path2, inst),
+            )
+        )
+
+        # The write back splice must happen serially after the checks.
+        mock_handle_write_back.assert_has_calls(
+            (
+                mocker.call(mock_section1, mock_temp_path1),
+                mocker.call(mock_section2, mock_temp_path2),
+            )
+        )
+
+        mock_tree.write.assert_called_with(
+            mock_open.return_value, encoding="utf-8", xml_declaration=True
+        )
+
 
 class TestMenuFile:
     """Test houdini_package_runner.items.xml.MenuFile."""
@@ -78,9 +78,7 @@ class TestFlake8Runner:
 
         assert inst._ignored == []
 
-        mock_super_init.assert_called_with(
-            mock_discoverer, write_back=True, runner_config=mock_config
-        )
+        mock_super_init.assert_called_with(mock_discoverer, runner_config=mock_config)
 
     # Properties
 
@@ -177,6 +175,7 @@ class TestFlake8Runner:
         "has_ignored, has_builtins, verbose",
         (
             (True, True, True),
+            (True, False, False),
             (False, False, False),
         ),
     )
@@ -238,6 +237,7 @@ class TestFlake8Runner:
 
         if has_ignored:
             inst._ignored = ["A123"]
+            inst._ignored_str = ",".join(inst._ignored)
             expected_ignored = inst._ignored + to_ignore
 
         inst.process_path(mock_path, mock_item)
@@ -272,6 +272,46 @@ class TestFlake8Runner:
 
         mock_execute.assert_called_with(expected_args, verbose=verbose)
 
+    @pytest.mark.parametrize("verbose", (True, False))
+    def test_process_paths(self, mocker, init_runner, verbose):
+        """Test Flake8Runner.process_paths."""
+        mock_print = mocker.patch(
+            "houdini_package_runner.runners.utils.print_runner_command"
+        )
+
+        mock_execute = mocker.patch(
+            "houdini_package_runner.utils.execute_subprocess_command", return_value=1
+        )
+
+        mock_item = mocker.MagicMock(spec=houdini_package_runner.items.base.BaseItem)
+
+        path1 = pathlib.Path("/some/file1.py")
+        path2 = pathlib.Path("/some/file2.py")
+
+        mocker.patch.object(
+            houdini_package_runner.runners.flake8.runner.Flake8Runner,
+            "_build_command",
+            return_value=["flake8", "--flag"],
+        )
+
+        inst = init_runner()
+        inst._verbose = verbose
+
+        result = inst.process_paths([path1, path2], mock_item)
+
+        assert result == 1
+
+        expected_args = ["flake8", "--flag", str(path1), str(path2)]
+
+        # Both paths share a flag set so only one command should be run.
+        mock_execute.assert_called_once_with(expected_args, verbose=verbose)
+
+        if verbose:
+            mock_print.assert_called_with(mock_item, expected_args)
+
+        else:
+            mock_print.assert_not_called()
+
 
 def test_main(mocker):
     """Test houdini_package_runner.runners.flake8.runner.main."""
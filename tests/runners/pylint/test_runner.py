@@ -190,8 +190,10 @@ class TestPyLintRunner:
         has_output,
     ):
         """Test PyLintRunner.process_path."""
-        mock_io = mocker.patch("houdini_package_runner.runners.pylint.runner.StringIO")
-        mock_io.return_value.getvalue.return_value = "foo" if has_output else ""
+        mock_buf = mocker.MagicMock(
+            spec=houdini_package_runner.runners.pylint.runner.StringIO
+        )
+        mock_buf.getvalue.return_value = "foo" if has_output else ""
 
         mock_run = mocker.patch("houdini_package_runner.runners.pylint.runner.lint.Run")
         mock_reporter = mocker.patch(
@@ -255,6 +257,7 @@ class TestPyLintRunner:
         inst = init_runner()
         inst._disabled = []
         inst._extra_args = []
+        inst._output_buf = mock_buf
         inst._verbose = verbose
 
         if has_disabled:
@@ -290,10 +293,14 @@ class TestPyLintRunner:
             expected_args, reporter=mock_reporter.return_value, exit=False
         )
 
-        mock_reporter.assert_called_with(mock_io.return_value)
+        mock_reporter.assert_called_with(mock_buf)
+
+        # The pooled buffer should be cleared before the run.
+        mock_buf.seek.assert_called_with(0)
+        mock_buf.truncate.assert_called()
 
         if has_output:
-            mock_write.assert_called_with(mock_io.return_value.getvalue.return_value)
+            mock_write.assert_called_with(mock_buf.getvalue.return_value)
 
         mock_config.get_config_data.assert_has_calls(
             [
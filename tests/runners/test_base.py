@@ -181,28 +181,77 @@ class TestHoudiniPackageRunner:
 
     # Methods
 
-    @pytest.mark.parametrize("has_hotl", (True, False))
-    def test_init_args_options(self, mocker, init_runner, has_hotl):
+    @pytest.mark.parametrize("has_optional", (True, False))
+    def test_init_args_options(self, mocker, init_runner, has_optional):
         """Test HoudiniPackageRunner.init_args_options."""
         mock_verbose = mocker.MagicMock(spec=bool)
         mock_list = mocker.MagicMock(spec=bool)
         mock_hotl = mocker.MagicMock(spec=str)
 
+        mock_mkdtemp = mocker.patch("tempfile.mkdtemp", return_value="/made/temp")
+
         namespace = argparse.Namespace()
         namespace.verbose = mock_verbose
         namespace.list_items = mock_list
 
-        if has_hotl:
+        if has_optional:
             namespace.hotl_command = mock_hotl
+            namespace.parallel = True
+            namespace.temp_dir = "/some/temp"
 
         inst = init_runner()
+        inst._parallel = False
 
         inst.init_args_options(namespace, [])
 
         assert inst._verbose == mock_verbose
 
-        if has_hotl:
+        if has_optional:
             assert inst._hotl_command == mock_hotl
+            assert inst._parallel
+            assert inst._temp_dir == pathlib.Path(mock_mkdtemp.return_value)
+
+            mock_mkdtemp.assert_called_with(dir="/some/temp")
+
+        else:
+            assert not inst._parallel
+
+            mock_mkdtemp.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "return_codes, expected",
+        (
+            ((0, 0), 0),
+            ((1, 0), 1),
+        ),
+    )
+    def test_process_paths(self, mocker, init_runner, return_codes, expected):
+        """Test HoudiniPackageRunner.process_paths."""
+        mock_item = mocker.MagicMock(
+            spec=houdini_package_runner.items.filesystem.FileToProcess
+        )
+
+        mock_path1 = mocker.MagicMock(spec=pathlib.Path)
+        mock_path2 = mocker.MagicMock(spec=pathlib.Path)
+
+        mock_process = mocker.patch.object(
+            houdini_package_runner.runners.base.HoudiniPackageRunner,
+            "process_path",
+            side_effect=return_codes,
+        )
+
+        inst = init_runner()
+
+        result = inst.process_paths([mock_path1, mock_path2], mock_item)
+
+        assert result == expected
+
+        mock_process.assert_has_calls(
+            [
+                mocker.call(mock_path1, mock_item),
+                mocker.call(mock_path2, mock_item),
+            ]
+        )
 
     @pytest.mark.parametrize(
         "list_items, write_back, return_codes, expected",
@@ -240,6 +289,7 @@ class TestHoudiniPackageRunner:
 
         inst = init_runner()
         inst._list_items = list_items
+        inst._parallel = False
         inst._write_back = write_back
 
         result = inst.run()
@@ -252,3 +302,18 @@ class TestHoudiniPackageRunner:
         if write_back:
             assert mock_file.write_back
             assert mock_dir.write_back
+
+
+@pytest.mark.parametrize("shm_available", (True, False))
+def test__get_temp_dir_base(mocker, shm_available):
+    """Test houdini_package_runner.runners.base._get_temp_dir_base."""
+    mocker.patch("os.path.isdir", return_value=shm_available)
+    mocker.patch("os.access", return_value=shm_available)
+
+    result = houdini_package_runner.runners.base._get_temp_dir_base()
+
+    if shm_available:
+        assert result == "/dev/shm"
+
+    else:
+        assert result is None
@@ -105,21 +105,30 @@ class TestBaseRunnerConfig:
 class TestPackageRunnerConfig:
     """Test houdini_package_runner.config.PackageRunnerConfig."""
 
-    def test__get_file_config_data(self, mocker, shared_datadir, init_package_config):
+    @pytest.mark.parametrize("has_file_data", (True, False))
+    def test__get_file_config_data(
+        self, mocker, shared_datadir, init_package_config, has_file_data
+    ):
         """Test PackageRunnerConfig._get_file_config_data."""
         config_file = shared_datadir / "get_file_config_data.toml"
 
         with config_file.open() as handle:
             data = toml.load(handle)
 
-        file_path = pathlib.Path("/foo/OnCreated.py")
+        file_path = pathlib.Path(
+            "/foo/OnCreated.py" if has_file_data else "/foo/Unknown.py"
+        )
 
         inst = init_package_config()
         inst._data = data
 
         result = inst._get_file_config_data(file_path, "to_ignore")
 
-        assert result == ["W292"]
+        if has_file_data:
+            assert result == ["W292"]
+
+        else:
+            assert result == []
 
     @pytest.mark.parametrize("test_item", (True, False))
     def test__get_item_config_data(
@@ -153,6 +162,12 @@ class TestPackageRunnerConfig:
 
         mock_build.assert_called_with(mock_item)
 
+        # A second lookup should come from the cache without rebuilding the
+        # config name list.
+        assert inst._get_item_config_data(mock_item, "to_ignore") == expected
+
+        mock_build.assert_called_once()
+
     def test_get_config_data(self, mocker, init_package_config):
         """Test PackageRunnerConfig.get_config_data."""
         mock_key = mocker.MagicMock(spec=str)
@@ -196,6 +211,21 @@ class TestPackageRunnerConfig:
         mock_load.assert_called_with(mock_name)
 
 
+def test__merge_conservative():
+    """Test houdini_package_runner.config._merge_conservative."""
+    target = {"shared": {"a": 1}, "value": "original", "target_only": True}
+    source = {"shared": {"a": 2, "b": 3}, "value": "new", "source_only": False}
+
+    houdini_package_runner.config._merge_conservative(target, source)
+
+    assert target == {
+        "shared": {"a": 1, "b": 3},
+        "value": "original",
+        "target_only": True,
+        "source_only": False,
+    }
+
+
 @pytest.mark.parametrize("config_path_set", (True, False))
 def test__find_config_files(mocker, config_path_set):
     """Test houdini_package_runner.config._find_config_files."""
@@ -215,20 +245,41 @@ def test__find_config_files(mocker, config_path_set):
         assert result == [pathlib.Path("path1"), pathlib.Path("path3")]
 
     else:
-        with importlib.resources.path("houdini_package_runner", "runners.toml") as path:
-            assert result == [path]
+        expected = pathlib.Path(
+            str(importlib.resources.files("houdini_package_runner") / "runners.toml")
+        )
+
+        assert result == [expected]
 
 
-def test__load_default_runner_config(mocker, shared_datadir):
+@pytest.mark.parametrize(
+    "multiple_files, use_tomllib",
+    (
+        (True, True),
+        (True, False),
+        (False, True),
+    ),
+)
+def test__load_default_runner_config(
+    mocker, shared_datadir, multiple_files, use_tomllib
+):
     """Test houdini_package_runner.config._load_default_runner_config."""
     test_data_path = shared_datadir / "test_load_runner_config"
 
+    if not use_tomllib:
+        mocker.patch("houdini_package_runner.config.tomllib", None)
+
+    paths = [test_data_path / "config1.toml"]
+
+    if multiple_files:
+        paths.append(test_data_path / "config2.toml")
+
     mocker.patch(
         "houdini_package_runner.config._find_config_files",
-        return_value=[test_data_path / "config1.toml", test_data_path / "config2.toml"],
+        return_value=paths,
     )
 
-    expected_path = test_data_path / "expected.toml"
+    expected_path = test_data_path / "expected.toml" if multiple_files else paths[0]
 
     with expected_path.open("r") as handle:
         expected_data = toml.load(handle)
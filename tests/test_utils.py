@@ -12,6 +12,8 @@ import os
 import pytest
 
 # Houdini Package Runner
+import houdini_package_runner.items.filesystem
+import houdini_package_runner.runners.base
 import houdini_package_runner.utils
 
 # =============================================================================
@@ -67,43 +69,93 @@ def test_add_or_append_to_flags(flags, key, values, sep, expected):
 )
 def test_execute_subprocess_command(mocker, fp, verbose, has_pyhome, return_code):
     """Test houdini_package_runner.utils.execute_subprocess_command."""
-    stdout = "This is stdout\n" if return_code and not verbose else None
-    stderr = "This is stderr\n" if return_code and not verbose else None
+    # stderr is redirected into the same stream as stdout.
+    stdout = "This is stdout\nThis is stderr\n" if return_code and not verbose else None
 
     mock_print = mocker.patch("builtins.print")
 
-    # Make a copy of the env to use for passing to the test.
+    # Build the env contents we want the code under test to see, explicitly
+    # controlling whether PYTHONHOME is set or not.
     dummy_env = os.environ.copy()
-
-    # Remove PYTHONHOME in case it is set, so we can explicitly control whether it is
-    # set or not.
-    if "PYTHONHOME" in dummy_env:
-        del dummy_env["PYTHONHOME"]
+    dummy_env.pop("PYTHONHOME", None)
 
     if has_pyhome:
         dummy_env["PYTHONHOME"] = "/some/path"
 
-    mocker.patch("os.environ.copy", return_value=dummy_env)
+    mocker.patch.dict(os.environ, dummy_env, clear=True)
+
+    copied_env = dict(dummy_env)
+    mock_copy = mocker.patch("os.environ.copy", return_value=copied_env)
 
     cmd = ["hotl", "-t", "foobles", "barbles.otl"]
 
-    fp.register(cmd, returncode=return_code, stdout=stdout, stderr=stderr)
+    fp.register(cmd, returncode=return_code, stdout=stdout)
 
     result = houdini_package_runner.utils.execute_subprocess_command(cmd, verbose)
 
     assert result == return_code
 
-    # If we are testing with PYTHONHOME in the env, make sure it got removed.
+    # If we are testing with PYTHONHOME in the env, make sure it got removed
+    # from the copy.  Otherwise no copy should have been made at all.
     if has_pyhome:
-        assert "PYTHONHOME" not in dummy_env
+        assert "PYTHONHOME" not in copied_env
+
+    else:
+        mock_copy.assert_not_called()
 
     if return_code and not verbose:
-        mock_print.assert_has_calls(
-            [
-                mocker.call(stdout.rstrip()),
-                mocker.call(stderr.rstrip()),
-            ]
+        mock_print.assert_called_with(stdout.rstrip())
+
+
+def test_get_item_temp_dir(tmp_path):
+    """Test houdini_package_runner.utils.get_item_temp_dir."""
+    result = houdini_package_runner.utils.get_item_temp_dir(tmp_path, "/some/item")
+
+    assert result.parent == tmp_path
+    assert result.is_dir()
+
+    # The same token maps to the same (already created) directory, while a
+    # different token gets its own.
+    assert (
+        houdini_package_runner.utils.get_item_temp_dir(tmp_path, "/some/item") == result
+    )
+    assert (
+        houdini_package_runner.utils.get_item_temp_dir(tmp_path, "/other/item")
+        != result
+    )
+
+
+@pytest.mark.parametrize(
+    "parallel, return_codes, expected",
+    (
+        (False, (0, 0), 0),
+        (False, (0, 1), 1),
+        (True, (0, 0), 0),
+        (True, (1, 0), 1),
+    ),
+)
+def test_process_items(mocker, parallel, return_codes, expected):
+    """Test houdini_package_runner.utils.process_items."""
+    mock_runner = mocker.MagicMock(
+        spec=houdini_package_runner.runners.base.HoudiniPackageRunner
+    )
+    mock_runner.parallel = parallel
+
+    items = []
+
+    for return_code in return_codes:
+        mock_item = mocker.MagicMock(
+            spec=houdini_package_runner.items.filesystem.FileToProcess
         )
+        mock_item.process.return_value = return_code
+        items.append(mock_item)
+
+    result = houdini_package_runner.utils.process_items(items, mock_runner)
+
+    assert result == expected
+
+    for item in items:
+        item.process.assert_called_with(mock_runner)
 
 
 @pytest.mark.parametrize(